@@ -0,0 +1,16 @@
+#!/bin/sh
+# Run the test scripts, preferring PyPy when it has the project's
+# dependencies installed. Extra arguments go to test_comprehensive.py.
+set -e
+
+cd "$(dirname "$0")/.."
+
+PYTHON="${PYTHON:-python3}"
+if command -v pypy3 >/dev/null 2>&1 \
+    && pypy3 -c "import PIL, numpy, cv2, httpx, loguru, pydantic_settings" 2>/dev/null; then
+    PYTHON=pypy3
+fi
+echo "Running tests with $("$PYTHON" --version 2>&1)"
+
+"$PYTHON" test_basic.py
+"$PYTHON" test_comprehensive.py "$@"
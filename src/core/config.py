@@ -70,6 +70,8 @@ class Settings(BaseSettings):
     video_fps: int = Field(default=30, alias="VIDEO_FPS")
     audio_bitrate: str = Field(default="128k", alias="AUDIO_BITRATE")
     video_bitrate: str = Field(default="5000k", alias="VIDEO_BITRATE")
+    # "auto" picks a working hardware H.264 encoder, falling back to libx264
+    video_codec: str = Field(default="auto", alias="VIDEO_CODEC")
 
     # Schedule Settings
     posting_schedule: str = Field(
@@ -102,6 +104,7 @@ class Settings(BaseSettings):
     image_output_path: Path = Field(
         default=Path("/app/data/images"), alias="IMAGE_OUTPUT_PATH"
     )
+    cache_path: Path = Field(default=Path("/app/data/cache"), alias="CACHE_PATH")
 
     # API Rate Limits
     openai_rpm: int = Field(default=500, alias="OPENAI_RPM")
@@ -109,6 +112,8 @@ class Settings(BaseSettings):
         default=100000, alias="ELEVENLABS_CHARACTER_LIMIT"
     )
     youtube_quota_daily: int = Field(default=10000, alias="YOUTUBE_QUOTA_DAILY")
+    # Celery rate limits are enforced per worker, not across the cluster
+    video_task_rate_limit: str = Field(default="10/m", alias="VIDEO_TASK_RATE_LIMIT")
 
     # Monitoring
     sentry_dsn: str = Field(default="", alias="SENTRY_DSN")
@@ -122,7 +127,13 @@ class Settings(BaseSettings):
     )
     enable_analytics: bool = Field(default=True, alias="ENABLE_ANALYTICS")
 
-    @field_validator("storage_path", "video_output_path", "audio_output_path", "image_output_path")
+    @field_validator(
+        "storage_path",
+        "video_output_path",
+        "audio_output_path",
+        "image_output_path",
+        "cache_path",
+    )
     @classmethod
     def create_directories(cls, v: Path) -> Path:
         """Create directories if they don't exist."""
@@ -253,6 +253,10 @@ class VideoGenerationPipeline:
             result["message"] = str(e)
             return result
 
+        finally:
+            # Release pooled image-download connections between runs
+            await self.visual_collector.close()
+
     async def generate_batch_videos(
         self,
         count: int = 3,
@@ -1,7 +1,8 @@
 """Quality check system for video content."""
 
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, FrozenSet, Tuple
 import re
 from datetime import datetime, timedelta
 
@@ -12,12 +13,30 @@ logger = get_logger(__name__)
 settings = get_settings()
 
 
+@lru_cache(maxsize=4096)
+def _title_words(title: str) -> FrozenSet[str]:
+    """Get the lowercased word set of a title, cached since the same recent
+    titles are compared against every new title.
+
+    Args:
+        title: Video title
+
+    Returns:
+        Set of lowercased words
+    """
+    return frozenset(title.lower().split())
+
+
 class QualityChecker:
     """Check video quality before publishing."""
 
     def __init__(self) -> None:
         """Initialize quality checker."""
         self.forbidden_keywords = settings.get_forbidden_keywords_list()
+        # Lowercased once here rather than on every check
+        self._forbidden_lower = [
+            (keyword, keyword.lower()) for keyword in self.forbidden_keywords
+        ]
         self.min_video_duration = 270  # 4.5 minutes
         self.max_video_duration = 330  # 5.5 minutes
         self.min_resolution = (1280, 720)
@@ -31,11 +50,10 @@ class QualityChecker:
         Returns:
             Tuple of (is_clean, list_of_found_keywords)
         """
-        found_keywords = []
-
-        for keyword in self.forbidden_keywords:
-            if keyword.lower() in text.lower():
-                found_keywords.append(keyword)
+        text_lower = text.lower()
+        found_keywords = [
+            keyword for keyword, lower in self._forbidden_lower if lower in text_lower
+        ]
 
         is_clean = len(found_keywords) == 0
 
@@ -62,14 +80,16 @@ class QualityChecker:
         """
         similar_titles = []
 
-        title_words = set(title.lower().split())
+        title_words = _title_words(title)
+        title_size = len(title_words)
 
         for recent_title in recent_titles:
-            recent_words = set(recent_title.lower().split())
+            recent_words = _title_words(recent_title)
 
-            # Jaccard similarity
+            # Jaccard similarity; the union size follows from the intersection
+            # without building the union set
             intersection = len(title_words & recent_words)
-            union = len(title_words | recent_words)
+            union = title_size + len(recent_words) - intersection
 
             if union > 0:
                 similarity = intersection / union
@@ -27,6 +27,18 @@ app.conf.update(
     task_soft_time_limit=3300,  # 55 minutes soft limit
     worker_prefetch_multiplier=1,
     worker_max_tasks_per_child=10,
+    # Video generation runs on its own queue; the number of concurrent
+    # generations is the concurrency (-c) of the workers consuming it
+    task_routes={
+        "src.scheduler.tasks.generate_and_upload_video": {"queue": "video"},
+    },
+    # Note: Celery enforces rate_limit per worker instance, not cluster-wide;
+    # N workers on the video queue together allow up to N times this rate
+    task_annotations={
+        "src.scheduler.tasks.generate_and_upload_video": {
+            "rate_limit": settings.video_task_rate_limit,
+        },
+    },
 )
 
 # Configure periodic tasks
@@ -56,6 +68,8 @@ app.conf.beat_schedule = {
         "args": ("weekly_summary",),
     },
     # Collect analytics data daily at 1:00 AM
+    # (newly uploaded videos are also collected an hour after upload via
+    # collect_analytics_for_video; this sweep keeps the daily history)
     "collect-analytics": {
         "task": "src.scheduler.tasks.collect_video_analytics",
         "schedule": crontab(hour=1, minute=0),
@@ -1,9 +1,13 @@
 """Celery tasks for scheduled operations."""
 
 import asyncio
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from celery import Task
 from celery.utils.log import get_task_logger
@@ -12,21 +16,132 @@ from src.scheduler.celery_app import app
 from src.core.config import get_settings
 from src.core.database import async_session_maker, Video, Analytics
 from src.pipeline.orchestrator import VideoGenerationPipeline
+from src.video.editor import CLIP_CACHE_PATH
+from src.voice.tts_generator import TTS_CACHE_PATH
+
+if TYPE_CHECKING:
+    from src.uploader.youtube_uploader import YouTubeUploader
 
 logger = get_task_logger(__name__)
 settings = get_settings()
 
+# Maximum number of concurrent unlink calls issued by cleanup_old_files
+CLEANUP_MAX_WORKERS = 32
+
+# Directory scan cache kept between cleanup_old_files runs
+CLEANUP_CACHE_FILENAME = "cleanup_cache.json"
+
+# Delay before the first analytics snapshot of a new upload (seconds);
+# statistics read right after upload are all zero
+ANALYTICS_FIRST_COLLECTION_DELAY = 3600
+
+YOUTUBE_CREDENTIALS_PATH = Path("config/youtube_credentials.json")
+
+_uploader: Optional["YouTubeUploader"] = None
+_uploader_lock = threading.Lock()
+
+
+def get_uploader() -> "YouTubeUploader":
+    """Get the authenticated YouTube uploader shared by this worker process.
+
+    The credentials file is read and the API client built only once; later
+    calls reuse the same client, which refreshes its token as needed.
+
+    Returns:
+        Authenticated YouTubeUploader instance
+    """
+    global _uploader
+
+    with _uploader_lock:
+        if _uploader is None:
+            from src.uploader.youtube_uploader import YouTubeUploader
+
+            uploader = YouTubeUploader()
+            uploader.authenticate(YOUTUBE_CREDENTIALS_PATH)
+            _uploader = uploader
+
+        return _uploader
+
+
+_event_loop: Optional[asyncio.AbstractEventLoop] = None
+_pipeline: Optional[VideoGenerationPipeline] = None
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """Get the event loop shared by all async tasks in this worker process.
+
+    Keeping one loop alive lets connection pools (OpenAI/HTTPX, asyncpg)
+    bound to it be reused across tasks instead of rebuilt per task.
+
+    Returns:
+        Worker event loop
+    """
+    global _event_loop
+
+    if _event_loop is None or _event_loop.is_closed():
+        _event_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_event_loop)
+
+    return _event_loop
+
+
+def get_pipeline() -> VideoGenerationPipeline:
+    """Get the video generation pipeline shared by this worker process.
+
+    Returns:
+        VideoGenerationPipeline instance
+    """
+    global _pipeline
+
+    if _pipeline is None:
+        _pipeline = VideoGenerationPipeline()
+
+    return _pipeline
+
+
+async def _save_uploaded_video(result: dict, upload_result: dict) -> int:
+    """Record an uploaded video in the database.
+
+    Args:
+        result: Pipeline result
+        upload_result: YouTube upload result
+
+    Returns:
+        ID of the new Video row
+    """
+    video_file = result.get("quality_check", {}).get("checks", {}).get("video_file", {})
+
+    async with async_session_maker() as session:
+        video = Video(
+            title=result["title"],
+            description=result.get("description"),
+            tags=result.get("tags"),
+            category=result["category"],
+            script=result.get("script", ""),
+            thumbnail_path=result.get("thumbnail_path"),
+            video_path=result["video_path"],
+            audio_path=result.get("audio_path"),
+            duration=video_file.get("details", {}).get("duration", 0),
+            youtube_id=upload_result["id"],
+            youtube_url=upload_result["url"],
+            status="uploaded",
+            uploaded_at=datetime.utcnow(),
+        )
+        session.add(video)
+        await session.commit()
+        return video.id
+
 
 class AsyncTask(Task):
     """Base task class for async operations."""
 
     def __call__(self, *args, **kwargs):
-        """Execute task in async context."""
-        return asyncio.run(self.run_async(*args, **kwargs))
+        """Execute task on the worker's persistent event loop."""
+        return get_event_loop().run_until_complete(self.run_async(*args, **kwargs))
 
     async def run_async(self, *args, **kwargs):
-        """Override this method in subclasses."""
-        raise NotImplementedError
+        """Run the task coroutine. Subclasses may override this method."""
+        return await self.run(*args, **kwargs)
 
 
 @app.task(
@@ -48,8 +163,8 @@ async def generate_and_upload_video(self, category: str = "technology") -> dict:
     logger.info(f"Starting video generation for category: {category}")
 
     try:
-        # Create pipeline
-        pipeline = VideoGenerationPipeline()
+        # Reuse the worker's pipeline and its API clients
+        pipeline = get_pipeline()
 
         # Generate topic based on category
         if category == "weekly_summary":
@@ -68,13 +183,8 @@ async def generate_and_upload_video(self, category: str = "technology") -> dict:
 
             # Upload to YouTube if enabled
             if result.get("video_path"):
-                from src.uploader.youtube_uploader import YouTubeUploader
-
-                uploader = YouTubeUploader()
-                credentials_path = Path("config/youtube_credentials.json")
-
                 try:
-                    uploader.authenticate(credentials_path)
+                    uploader = get_uploader()
 
                     upload_result = await uploader.upload_video(
                         video_path=Path(result["video_path"]),
@@ -100,6 +210,20 @@ async def generate_and_upload_video(self, category: str = "technology") -> dict:
                     logger.error(f"Failed to upload to YouTube: {e}")
                     result["upload_error"] = str(e)
 
+            if result.get("youtube_id"):
+                try:
+                    result["db_id"] = await _save_uploaded_video(result, upload_result)
+
+                    # Collect analytics from the upload event instead of waiting
+                    # for the next periodic sweep, once YouTube has stats to report
+                    collect_analytics_for_video.apply_async(
+                        args=(upload_result["id"],),
+                        countdown=ANALYTICS_FIRST_COLLECTION_DELAY,
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to record uploaded video: {e}")
+                    result["db_error"] = str(e)
+
         return result
 
     except Exception as exc:
@@ -108,7 +232,7 @@ async def generate_and_upload_video(self, category: str = "technology") -> dict:
         raise self.retry(exc=exc)
 
 
-@app.task(name="src.scheduler.tasks.collect_video_analytics")
+@app.task(name="src.scheduler.tasks.collect_video_analytics", base=AsyncTask)
 async def collect_video_analytics() -> dict:
     """Collect analytics data for all published videos.
 
@@ -118,14 +242,10 @@ async def collect_video_analytics() -> dict:
     logger.info("Collecting video analytics")
 
     try:
-        from src.uploader.youtube_uploader import YouTubeUploader
         from sqlalchemy import select
 
-        uploader = YouTubeUploader()
-        credentials_path = Path("config/youtube_credentials.json")
-
         try:
-            uploader.authenticate(credentials_path)
+            uploader = get_uploader()
         except Exception as e:
             logger.error(f"Failed to authenticate with YouTube: {e}")
             return {"status": "error", "message": str(e)}
@@ -140,27 +260,30 @@ async def collect_video_analytics() -> dict:
             )
             videos = result.scalars().all()
 
+            # Get analytics from YouTube in batched requests
+            analytics_by_id = await uploader.get_videos_analytics(
+                [video.youtube_id for video in videos]
+            )
+
             for video in videos:
-                try:
-                    # Get analytics from YouTube
-                    analytics_data = await uploader.get_video_analytics(video.youtube_id)
-
-                    if analytics_data:
-                        # Save to database
-                        analytics = Analytics(
-                            video_id=video.id,
-                            youtube_id=video.youtube_id,
-                            views=analytics_data.get("views", 0),
-                            likes=analytics_data.get("likes", 0),
-                            comments=analytics_data.get("comments", 0),
-                            data_snapshot=analytics_data,
-                        )
-                        session.add(analytics)
-                        collected += 1
+                analytics_data = analytics_by_id.get(video.youtube_id)
 
-                except Exception as e:
-                    logger.error(f"Error collecting analytics for video {video.id}: {e}")
+                if not analytics_data:
+                    logger.error(f"No analytics returned for video {video.id}")
                     errors += 1
+                    continue
+
+                # Save to database
+                analytics = Analytics(
+                    video_id=video.id,
+                    youtube_id=video.youtube_id,
+                    views=analytics_data.get("views", 0),
+                    likes=analytics_data.get("likes", 0),
+                    comments=analytics_data.get("comments", 0),
+                    data_snapshot=analytics_data,
+                )
+                session.add(analytics)
+                collected += 1
 
             await session.commit()
 
@@ -177,6 +300,89 @@ async def collect_video_analytics() -> dict:
         return {"status": "error", "message": str(e)}
 
 
+@app.task(name="src.scheduler.tasks.collect_analytics_for_video", base=AsyncTask)
+async def collect_analytics_for_video(youtube_id: str) -> dict:
+    """Collect analytics data for a single video after it is uploaded.
+
+    Args:
+        youtube_id: YouTube video ID
+
+    Returns:
+        Dictionary with collection result
+    """
+    logger.info(f"Collecting analytics for uploaded video: {youtube_id}")
+
+    try:
+        from sqlalchemy import select
+
+        uploader = get_uploader()
+
+        async with async_session_maker() as session:
+            result = await session.execute(
+                select(Video).where(Video.youtube_id == youtube_id)
+            )
+            video = result.scalar_one_or_none()
+
+            if video is None:
+                logger.warning(f"No video record found for YouTube ID: {youtube_id}")
+                return {"status": "skipped", "youtube_id": youtube_id}
+
+            analytics_data = await uploader.get_video_analytics(youtube_id)
+
+            # get_video_analytics logs failures and returns an empty dict
+            if not analytics_data:
+                logger.error(f"No analytics returned for video {video.id}")
+                return {
+                    "status": "error",
+                    "youtube_id": youtube_id,
+                    "message": "No analytics returned",
+                }
+
+            session.add(
+                Analytics(
+                    video_id=video.id,
+                    youtube_id=youtube_id,
+                    views=analytics_data.get("views", 0),
+                    likes=analytics_data.get("likes", 0),
+                    comments=analytics_data.get("comments", 0),
+                    data_snapshot=analytics_data,
+                )
+            )
+            await session.commit()
+
+        return {"status": "success", "youtube_id": youtube_id}
+
+    except Exception as e:
+        logger.error(f"Error collecting analytics for {youtube_id}: {e}")
+        return {"status": "error", "message": str(e)}
+
+
+def _load_cleanup_cache() -> dict:
+    """Load the directory scan cache used by cleanup_old_files.
+
+    Returns:
+        Mapping of directory path to its last seen mtime and oldest file mtime
+    """
+    try:
+        with open(settings.cache_path / CLEANUP_CACHE_FILENAME, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cleanup_cache(cache: dict) -> None:
+    """Persist the directory scan cache used by cleanup_old_files.
+
+    Args:
+        cache: Mapping of directory path to its last seen mtime and oldest file mtime
+    """
+    try:
+        with open(settings.cache_path / CLEANUP_CACHE_FILENAME, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+    except OSError as e:
+        logger.warning(f"Failed to save cleanup cache: {e}")
+
+
 @app.task(name="src.scheduler.tasks.cleanup_old_files")
 def cleanup_old_files(days_old: int = 30) -> dict:
     """Clean up old video, audio, and image files.
@@ -193,33 +399,79 @@ def cleanup_old_files(days_old: int = 30) -> dict:
     freed_space = 0
 
     try:
-        cutoff_date = datetime.now() - timedelta(days=days_old)
+        cutoff_timestamp = (datetime.now() - timedelta(days=days_old)).timestamp()
         directories = [
             settings.video_output_path,
             settings.audio_output_path,
             settings.image_output_path,
+            CLIP_CACHE_PATH,
+            TTS_CACHE_PATH,
         ]
 
-        for directory in directories:
-            if not directory.exists():
-                continue
+        cache = _load_cleanup_cache()
+        # Oldest remaining file mtime per scanned directory
+        scanned = {}
 
-            for file_path in directory.glob("*"):
-                if not file_path.is_file():
+        # Unlinks are issued from a thread pool while the directories are still
+        # being scanned; on network storage each unlink is a round-trip.
+        with ThreadPoolExecutor(max_workers=CLEANUP_MAX_WORKERS) as executor:
+            futures = {}
+
+            for directory in directories:
+                if not directory.exists():
+                    continue
+
+                key = str(directory)
+                dir_mtime = os.stat(directory).st_mtime
+
+                # An unchanged directory whose oldest file is still newer than
+                # the cutoff has nothing to delete
+                cached = cache.get(key)
+                if (
+                    cached
+                    and cached["dir_mtime"] == dir_mtime
+                    and (
+                        cached["oldest_mtime"] is None
+                        or cached["oldest_mtime"] >= cutoff_timestamp
+                    )
+                ):
+                    logger.debug(f"Skipping unchanged directory: {directory}")
                     continue
 
-                # Check file age
-                file_mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
-
-                if file_mtime < cutoff_date:
-                    file_size = file_path.stat().st_size
-                    try:
-                        file_path.unlink()
-                        deleted_count += 1
-                        freed_space += file_size
-                        logger.debug(f"Deleted: {file_path}")
-                    except Exception as e:
-                        logger.error(f"Failed to delete {file_path}: {e}")
+                oldest_mtime = None
+
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if not entry.is_file():
+                            continue
+
+                        # Check file age
+                        stat = entry.stat()
+                        if stat.st_mtime < cutoff_timestamp:
+                            future = executor.submit(os.unlink, entry.path)
+                            futures[future] = (entry.path, stat.st_size, key, stat.st_mtime)
+                        elif oldest_mtime is None or stat.st_mtime < oldest_mtime:
+                            oldest_mtime = stat.st_mtime
+
+                scanned[key] = {"dir_mtime": dir_mtime, "oldest_mtime": oldest_mtime}
+
+            for future in as_completed(futures):
+                file_path, file_size, key, file_mtime = futures[future]
+                try:
+                    future.result()
+                    deleted_count += 1
+                    freed_space += file_size
+                    logger.debug(f"Deleted: {file_path}")
+                except Exception as e:
+                    logger.error(f"Failed to delete {file_path}: {e}")
+                    # The file is still there, so keep the directory due for a rescan
+                    scanned[key]["oldest_mtime"] = file_mtime
+
+        # The directory mtimes are the ones taken before each scan, so files
+        # created since then, and the deletions above, force a rescan next run
+        cache.update(scanned)
+
+        _save_cleanup_cache(cache)
 
         freed_space_mb = freed_space / (1024 * 1024)
         logger.info(
@@ -1,16 +1,100 @@
 """SEO optimization module for YouTube videos."""
 
-from typing import List, Dict
+from typing import Awaitable, List, Dict, Optional, Tuple, TypeVar
+import asyncio
+import json
 import re
 
 from openai import AsyncOpenAI
+from redis import asyncio as aioredis
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import TimeoutError as RedisTimeoutError
 
 from src.core.config import get_settings
 from src.core.logging import get_logger
+from src.utils.helpers import generate_hash, truncate_text
 
 logger = get_logger(__name__)
 settings = get_settings()
 
+T = TypeVar("T")
+
+# Character classes checked by analyze_title_quality
+_TITLE_BRACKETS = frozenset("【】[]")
+_TITLE_PUNCTUATION = frozenset("!?！？")
+
+# Characters stripped from keywords when building hashtags
+_NON_WORD_RE = re.compile(r"\W+")
+
+# Completion token budget per requested output character; Japanese text is
+# often more than one token per character
+TOKENS_PER_CHAR = 2
+MAX_COMPLETION_TOKENS = 4096
+
+# Default output limits for titles, descriptions and tags
+MAX_TITLE_LENGTH = 60
+MAX_DESCRIPTION_LENGTH = 5000
+MAX_TAGS = 15
+
+# Optimized metadata is cached in Redis for retries of the same inputs
+METADATA_CACHE_PREFIX = "seo:metadata:"
+METADATA_CACHE_TTL = 86400  # 24 hours
+
+# Redis connect and read timeout (seconds); the cache is optional, so an
+# unreachable server must not stall metadata generation
+METADATA_CACHE_TIMEOUT = 1.0
+
+# Prompt templates, built once and filled in per request
+_TITLE_PROMPT = """以下のYouTube動画タイトルをSEOとクリック率向上のために最適化してください。
+
+元のタイトル: {title}
+キーワード: {keywords_str}
+
+最適化の要件:
+1. {max_length}文字以内
+2. 重要なキーワードを前方に配置
+3. 数字や記号を効果的に使用（【】、！、？など）
+4. クリックしたくなる表現
+5. 誇張しすぎない（クリックベイト回避）
+6. 日本語で自然な表現
+
+最適化されたタイトルのみを返してください（説明不要）。
+"""
+
+_DESCRIPTION_PROMPT = """YouTube動画の説明文を作成してください。
+
+タイトル: {title}
+内容の概要: {script_preview}...
+キーワード: {keywords_str}
+
+要件:
+1. 最初の150文字が特に重要（検索結果に表示される）
+2. キーワードを自然に含める
+3. 視聴者に価値を伝える
+4. タイムスタンプを含める（例: 0:00 イントロ、0:30 本編開始）
+5. 関連リンクやハッシュタグを含める
+6. チャンネル登録を促す
+7. {max_length}文字以内
+
+説明文を返してください。
+"""
+
+_TAGS_PROMPT = """YouTube動画のタグを生成してください。
+
+タイトル: {title}
+カテゴリ: {category}
+内容: {content_preview}...
+
+要件:
+1. {max_tags}個のタグ
+2. 幅広いタグ（一般的）と狭いタグ（特化）を混在
+3. 競合チャンネルが使いそうなタグ
+4. ロングテールキーワードを含める
+5. 日本語と英語を混在させる
+
+タグのみをカンマ区切りで返してください（説明不要）。
+"""
+
 
 class SEOOptimizer:
     """Optimize video metadata for YouTube SEO."""
@@ -19,12 +103,19 @@ class SEOOptimizer:
         """Initialize SEO optimizer."""
         self.client = AsyncOpenAI(api_key=settings.openai_api_key)
         self.model = settings.openai_model
+        self.cache = aioredis.Redis.from_url(
+            settings.redis_url,
+            socket_connect_timeout=METADATA_CACHE_TIMEOUT,
+            socket_timeout=METADATA_CACHE_TIMEOUT,
+        )
+        # Cleared after the first connection error so later calls skip Redis
+        self._cache_available = True
 
     async def optimize_title(
         self,
         title: str,
         keywords: List[str],
-        max_length: int = 60,
+        max_length: int = MAX_TITLE_LENGTH,
     ) -> str:
         """Optimize video title for SEO and CTR.
 
@@ -34,52 +125,44 @@ class SEOOptimizer:
             max_length: Maximum title length
 
         Returns:
-            Optimized title
+            Optimized title, or the original title if optimization fails
         """
-        try:
-            keywords_str = ", ".join(keywords[:5])
-
-            prompt = f"""以下のYouTube動画タイトルをSEOとクリック率向上のために最適化してください。
-
-元のタイトル: {title}
-キーワード: {keywords_str}
+        optimized_title, _ = await self._with_fallback(
+            self._request_title(title, keywords, max_length), title, "optimizing title"
+        )
+        return optimized_title
 
-最適化の要件:
-1. {max_length}文字以内
-2. 重要なキーワードを前方に配置
-3. 数字や記号を効果的に使用（【】、！、？など）
-4. クリックしたくなる表現
-5. 誇張しすぎない（クリックベイト回避）
-6. 日本語で自然な表現
+    async def _request_title(self, title: str, keywords: List[str], max_length: int) -> str:
+        """Request an optimized title from OpenAI; raises on failure."""
+        keywords_str = ", ".join(keywords[:5])
 
-最適化されたタイトルのみを返してください（説明不要）。
-"""
-
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.7,
-            )
+        prompt = _TITLE_PROMPT.format(
+            title=title,
+            keywords_str=keywords_str,
+            max_length=max_length,
+        )
 
-            optimized_title = response.choices[0].message.content.strip()
+        response = await self.client.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.7,
+            max_tokens=self._max_tokens_for(max_length),
+        )
 
-            # Ensure length limit
-            if len(optimized_title) > max_length:
-                optimized_title = optimized_title[:max_length-3] + "..."
+        optimized_title = response.choices[0].message.content.strip()
 
-            logger.info(f"Optimized title: '{title}' -> '{optimized_title}'")
-            return optimized_title
+        # Ensure length limit
+        optimized_title = truncate_text(optimized_title, max_length)
 
-        except Exception as e:
-            logger.error(f"Error optimizing title: {e}")
-            return title  # Return original on error
+        logger.info(f"Optimized title: '{title}' -> '{optimized_title}'")
+        return optimized_title
 
     async def generate_description(
         self,
         title: str,
         script: str,
         keywords: List[str],
-        max_length: int = 5000,
+        max_length: int = MAX_DESCRIPTION_LENGTH,
     ) -> str:
         """Generate SEO-optimized video description.
 
@@ -90,56 +173,54 @@ class SEOOptimizer:
             max_length: Maximum description length
 
         Returns:
-            Optimized description
+            Optimized description, or a simple description if generation fails
         """
-        try:
-            keywords_str = ", ".join(keywords[:10])
-            script_preview = script[:500]
-
-            prompt = f"""YouTube動画の説明文を作成してください。
-
-タイトル: {title}
-内容の概要: {script_preview}...
-キーワード: {keywords_str}
-
-要件:
-1. 最初の150文字が特に重要（検索結果に表示される）
-2. キーワードを自然に含める
-3. 視聴者に価値を伝える
-4. タイムスタンプを含める（例: 0:00 イントロ、0:30 本編開始）
-5. 関連リンクやハッシュタグを含める
-6. チャンネル登録を促す
-7. {max_length}文字以内
-
-説明文を返してください。
-"""
+        description, _ = await self._with_fallback(
+            self._request_description(title, script, keywords, max_length),
+            self._fallback_description(title, script),
+            "generating description",
+        )
+        return description
 
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.7,
-            )
+    async def _request_description(
+        self,
+        title: str,
+        script: str,
+        keywords: List[str],
+        max_length: int,
+    ) -> str:
+        """Request a video description from OpenAI; raises on failure."""
+        keywords_str = ", ".join(keywords[:10])
+        script_preview = script[:500]
+
+        prompt = _DESCRIPTION_PROMPT.format(
+            title=title,
+            script_preview=script_preview,
+            keywords_str=keywords_str,
+            max_length=max_length,
+        )
 
-            description = response.choices[0].message.content.strip()
+        response = await self.client.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.7,
+            max_tokens=self._max_tokens_for(max_length),
+        )
 
-            # Ensure length limit
-            if len(description) > max_length:
-                description = description[:max_length]
+        description = response.choices[0].message.content.strip()
 
-            logger.info(f"Generated description: {len(description)} characters")
-            return description
+        # Ensure length limit
+        description = truncate_text(description, max_length, suffix="")
 
-        except Exception as e:
-            logger.error(f"Error generating description: {e}")
-            # Fallback to simple description
-            return f"{title}\n\n{script[:300]}...\n\n#YouTube #動画"
+        logger.info(f"Generated description: {len(description)} characters")
+        return description
 
     async def generate_tags(
         self,
         title: str,
         content: str,
         category: str,
-        max_tags: int = 15,
+        max_tags: int = MAX_TAGS,
     ) -> List[str]:
         """Generate optimized tags for video.
 
@@ -150,50 +231,89 @@ class SEOOptimizer:
             max_tags: Maximum number of tags
 
         Returns:
-            List of tags
+            List of tags, or basic category tags if generation fails
         """
-        try:
-            content_preview = content[:500]
+        tags, _ = await self._with_fallback(
+            self._request_tags(title, content, category, max_tags),
+            self._fallback_tags(category),
+            "generating tags",
+        )
+        return tags
 
-            prompt = f"""YouTube動画のタグを生成してください。
+    async def _request_tags(
+        self,
+        title: str,
+        content: str,
+        category: str,
+        max_tags: int,
+    ) -> List[str]:
+        """Request video tags from OpenAI; raises on failure."""
+        content_preview = content[:500]
+
+        prompt = _TAGS_PROMPT.format(
+            title=title,
+            category=category,
+            content_preview=content_preview,
+            max_tags=max_tags,
+        )
 
-タイトル: {title}
-カテゴリ: {category}
-内容: {content_preview}...
+        response = await self.client.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.7,
+        )
 
-要件:
-1. {max_tags}個のタグ
-2. 幅広いタグ（一般的）と狭いタグ（特化）を混在
-3. 競合チャンネルが使いそうなタグ
-4. ロングテールキーワードを含める
-5. 日本語と英語を混在させる
+        tags_str = response.choices[0].message.content.strip()
 
-タグのみをカンマ区切りで返してください（説明不要）。
-"""
+        # Parse tags, removing duplicates and stopping at the limit
+        tags = []
+        seen = set()
+        for tag in tags_str.split(","):
+            tag = tag.strip()
+            if tag and tag not in seen:
+                seen.add(tag)
+                tags.append(tag)
+                if len(tags) == max_tags:
+                    break
 
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.7,
-            )
+        logger.info(f"Generated {len(tags)} tags")
+        return tags
 
-            tags_str = response.choices[0].message.content.strip()
+    async def _with_fallback(
+        self,
+        request: Awaitable[T],
+        fallback: T,
+        action: str,
+    ) -> Tuple[T, bool]:
+        """Await an OpenAI request, substituting a fallback value on error.
 
-            # Parse tags
-            tags = [tag.strip() for tag in tags_str.split(",")]
+        Args:
+            request: Request coroutine
+            fallback: Value returned if the request fails
+            action: Description of the request for the error log
+
+        Returns:
+            Tuple of (result, whether the request succeeded)
+        """
+        try:
+            return await request, True
+        except Exception as e:
+            logger.error(f"Error {action}: {e}")
+            return fallback, False
 
-            # Remove duplicates and limit
-            tags = list(dict.fromkeys(tags))[:max_tags]
+    def _max_tokens_for(self, max_length: int) -> int:
+        """Get the completion token budget for an output length limit."""
+        return min(max_length * TOKENS_PER_CHAR, MAX_COMPLETION_TOKENS)
 
-            logger.info(f"Generated {len(tags)} tags")
-            return tags
+    def _fallback_description(self, title: str, script: str) -> str:
+        """Build the description used when generation fails."""
+        return f"{title}\n\n{script[:300]}...\n\n#YouTube #動画"
 
-        except Exception as e:
-            logger.error(f"Error generating tags: {e}")
-            # Fallback to basic tags
-            return [category, "日本語", "解説", "まとめ", "ニュース"]
+    def _fallback_tags(self, category: str) -> List[str]:
+        """Build the tags used when generation fails."""
+        return [category, "日本語", "解説", "まとめ", "ニュース"]
 
-    async def generate_hashtags(
+    def generate_hashtags(
         self,
         title: str,
         keywords: List[str],
@@ -214,7 +334,7 @@ class SEOOptimizer:
 
         for keyword in keywords[:max_hashtags]:
             # Clean keyword (remove spaces, special chars)
-            clean_keyword = re.sub(r'[^\w]', '', keyword)
+            clean_keyword = _NON_WORD_RE.sub("", keyword)
             if clean_keyword:
                 hashtags.append(f"#{clean_keyword}")
 
@@ -245,19 +365,38 @@ class SEOOptimizer:
         """
         logger.info("Optimizing all video metadata")
 
-        # Optimize title
-        optimized_title = await self.optimize_title(title, keywords)
+        cache_key = METADATA_CACHE_PREFIX + generate_hash(
+            "|".join([self.model, category, title, script, ",".join(keywords)])
+        )
+
+        cached = await self._get_cached_metadata(cache_key)
+        if cached is not None:
+            logger.info("Using cached metadata for identical inputs")
+            return cached
 
-        # Generate description
-        description = await self.generate_description(
-            optimized_title, script, keywords
+        # Optimize title
+        optimized_title, title_ok = await self._with_fallback(
+            self._request_title(title, keywords, MAX_TITLE_LENGTH), title, "optimizing title"
         )
 
-        # Generate tags
-        tags = await self.generate_tags(optimized_title, script, category)
+        # Generate description and tags concurrently (both only need the title)
+        (description, description_ok), (tags, tags_ok) = await asyncio.gather(
+            self._with_fallback(
+                self._request_description(
+                    optimized_title, script, keywords, MAX_DESCRIPTION_LENGTH
+                ),
+                self._fallback_description(optimized_title, script),
+                "generating description",
+            ),
+            self._with_fallback(
+                self._request_tags(optimized_title, script, category, MAX_TAGS),
+                self._fallback_tags(category),
+                "generating tags",
+            ),
+        )
 
         # Generate hashtags
-        hashtags = await self.generate_hashtags(optimized_title, keywords)
+        hashtags = self.generate_hashtags(optimized_title, keywords)
 
         metadata = {
             "title": optimized_title,
@@ -267,9 +406,57 @@ class SEOOptimizer:
             "category": category,
         }
 
+        # Only cache results where every OpenAI call succeeded
+        if title_ok and description_ok and tags_ok:
+            await self._set_cached_metadata(cache_key, metadata)
+
         logger.info("Metadata optimization complete")
         return metadata
 
+    async def _get_cached_metadata(self, key: str) -> Optional[Dict[str, any]]:
+        """Get previously optimized metadata from the cache.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached metadata or None
+        """
+        if not self._cache_available:
+            return None
+
+        try:
+            cached = await self.cache.get(key)
+        except (RedisConnectionError, RedisTimeoutError) as e:
+            logger.warning(f"Metadata cache unavailable, disabling it: {e}")
+            self._cache_available = False
+            return None
+        except Exception as e:
+            logger.warning(f"Metadata cache unavailable: {e}")
+            return None
+
+        return json.loads(cached) if cached else None
+
+    async def _set_cached_metadata(self, key: str, metadata: Dict[str, any]) -> None:
+        """Store optimized metadata in the cache.
+
+        Args:
+            key: Cache key
+            metadata: Optimized metadata
+        """
+        if not self._cache_available:
+            return
+
+        try:
+            await self.cache.set(
+                key, json.dumps(metadata, ensure_ascii=False), ex=METADATA_CACHE_TTL
+            )
+        except (RedisConnectionError, RedisTimeoutError) as e:
+            logger.warning(f"Metadata cache unavailable, disabling it: {e}")
+            self._cache_available = False
+        except Exception as e:
+            logger.warning(f"Failed to cache metadata: {e}")
+
     def analyze_title_quality(self, title: str) -> Dict[str, any]:
         """Analyze title quality and provide recommendations.
 
@@ -279,11 +466,25 @@ class SEOOptimizer:
         Returns:
             Dictionary with analysis results
         """
+        # Single pass over the title instead of one regex scan per class
+        has_numbers = has_brackets = has_punctuation = False
+        for ch in title:
+            if ch.isdecimal():
+                has_numbers = True
+            elif ch in _TITLE_BRACKETS:
+                has_brackets = True
+            elif ch in _TITLE_PUNCTUATION:
+                has_punctuation = True
+            else:
+                continue
+            if has_numbers and has_brackets and has_punctuation:
+                break
+
         analysis = {
             "length": len(title),
-            "has_numbers": bool(re.search(r'\d', title)),
-            "has_brackets": bool(re.search(r'[【】\[\]]', title)),
-            "has_punctuation": bool(re.search(r'[!?！？]', title)),
+            "has_numbers": has_numbers,
+            "has_brackets": has_brackets,
+            "has_punctuation": has_punctuation,
             "score": 0.0,
             "recommendations": [],
         }
@@ -1,9 +1,12 @@
 """Thumbnail generation module for YouTube videos."""
 
+import asyncio
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple
 import random
 
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont, ImageFilter, ImageEnhance
 
 from src.core.config import get_settings
@@ -13,6 +16,96 @@ from src.utils.helpers import ensure_directory
 logger = get_logger(__name__)
 settings = get_settings()
 
+# Margin around a shape, in multiples of the blur radius, kept when blurring
+# it on a cropped canvas instead of the full frame
+BLUR_PAD_PER_RADIUS = 3
+
+# Blur radius of the colorful template's decorative circles, and the logistic
+# scale (relative to it) that matches a Gaussian-blurred disc edge
+CIRCLE_BLUR_RADIUS = 20
+CIRCLE_EDGE_SCALE = 0.551
+
+# Opacity of the minimal template's white overlay, and the per-channel lookup
+# table equivalent to pasting it over the background
+MINIMAL_OVERLAY_ALPHA = 200
+_MINIMAL_OVERLAY_LUT = [
+    round(v + (255 - v) * MINIMAL_OVERLAY_ALPHA / 255) for v in range(256)
+] * 3
+
+# JPEG quality for saved thumbnails; a single-pass encode without Huffman
+# optimization, which costs far more time than the bytes it saves
+THUMBNAIL_JPEG_QUALITY = 90
+
+# Candidate TrueType fonts, tried in order
+FONT_PATHS = [
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+    "/System/Library/Fonts/Helvetica.ttc",
+    "C:\\Windows\\Fonts\\arial.ttf",
+]
+
+
+@lru_cache(maxsize=32)
+def _load_font(size: int) -> ImageFont.FreeTypeFont:
+    """Load the first available TrueType font, cached per size.
+
+    Args:
+        size: Font size
+
+    Returns:
+        Font object
+    """
+    for font_path in FONT_PATHS:
+        try:
+            return ImageFont.truetype(font_path, size)
+        except Exception:
+            continue
+
+    logger.warning("No TrueType font found, using default")
+    return ImageFont.load_default()
+
+
+@lru_cache(maxsize=1024)
+def _measure_text(font: ImageFont.FreeTypeFont, text: str) -> Tuple[int, int, int, int]:
+    """Get the bounding box of text, cached per font and text.
+
+    Args:
+        font: Font to use
+        text: Text to measure
+
+    Returns:
+        Bounding box as (left, top, right, bottom)
+    """
+    return font.getbbox(text)
+
+
+@lru_cache(maxsize=8)
+def _gradient_image(
+    color_start: Tuple[int, int, int],
+    color_end: Tuple[int, int, int],
+    width: int,
+    height: int,
+) -> Image.Image:
+    """Render a vertical gradient, cached per colours and size.
+
+    Args:
+        color_start: Start RGB color
+        color_end: End RGB color
+        width: Image width
+        height: Image height
+
+    Returns:
+        Image with gradient
+    """
+    # Compute one RGB value per row, then stretch the 1px column to full
+    # width (nearest-neighbour keeps every row a flat colour)
+    start = np.array(color_start, dtype=np.float64)
+    end = np.array(color_end, dtype=np.float64)
+    t = np.arange(height, dtype=np.float64)[:, None] / height
+    column = (start + (end - start) * t).astype(np.uint8)
+
+    img = Image.fromarray(column[:, None, :], "RGB")
+    return img.resize((width, height), Image.Resampling.NEAREST)
+
 
 class ThumbnailGenerator:
     """Generate eye-catching thumbnails for YouTube videos."""
@@ -32,20 +125,7 @@ class ThumbnailGenerator:
         Returns:
             Font object
         """
-        font_paths = [
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
-            "/System/Library/Fonts/Helvetica.ttc",
-            "C:\\Windows\\Fonts\\arial.ttf",
-        ]
-
-        for font_path in font_paths:
-            try:
-                return ImageFont.truetype(font_path, size)
-            except Exception:
-                continue
-
-        logger.warning("No TrueType font found, using default")
-        return ImageFont.load_default()
+        return _load_font(size)
 
     def _wrap_text(
         self,
@@ -66,18 +146,22 @@ class ThumbnailGenerator:
         words = text.split()
         lines = []
         current_line = []
+        current_width = 0.0
+        space_width = font.getlength(" ")
 
+        # Accumulate word advances instead of re-measuring every candidate line
         for word in words:
-            test_line = " ".join(current_line + [word])
-            bbox = font.getbbox(test_line)
-            width = bbox[2] - bbox[0]
+            word_width = font.getlength(word)
+            width = current_width + space_width + word_width if current_line else word_width
 
             if width <= max_width:
                 current_line.append(word)
+                current_width = width
             else:
                 if current_line:
                     lines.append(" ".join(current_line))
                     current_line = [word]
+                    current_width = word_width
                 else:
                     lines.append(word)
 
@@ -100,19 +184,54 @@ class ThumbnailGenerator:
         Returns:
             Image with gradient
         """
-        img = Image.new("RGB", (self.width, self.height))
-        draw = ImageDraw.Draw(img)
+        # Copy so callers can draw on the result without touching the cache
+        return _gradient_image(
+            tuple(color_start), tuple(color_end), self.width, self.height
+        ).copy()
 
-        for y in range(self.height):
-            r = int(color_start[0] + (color_end[0] - color_start[0]) * y / self.height)
-            g = int(color_start[1] + (color_end[1] - color_start[1]) * y / self.height)
-            b = int(color_start[2] + (color_end[2] - color_start[2]) * y / self.height)
+    def _blend_soft_circle(
+        self,
+        pixels: np.ndarray,
+        x: int,
+        y: int,
+        size: int,
+        alpha: int,
+    ) -> None:
+        """Blend a blurred translucent white circle into an RGB pixel array.
 
-            draw.line([(0, y), (self.width, y)], fill=(r, g, b))
+        The blurred edge is evaluated analytically on the circle's bounding
+        region instead of blurring a full-frame layer.
 
-        return img
-
-    async def generate_bold_template(
+        Args:
+            pixels: uint8 RGB array of shape (height, width, 3), modified in place
+            x: Left edge of the circle's bounding box
+            y: Top edge of the circle's bounding box
+            size: Circle diameter
+            alpha: Circle opacity (0-255)
+        """
+        pad = BLUR_PAD_PER_RADIUS * CIRCLE_BLUR_RADIUS
+        x0, x1 = max(x - pad, 0), min(x + size + pad, self.width)
+        y0, y1 = max(y - pad, 0), min(y + size + pad, self.height)
+        if x0 >= x1 or y0 >= y1:
+            return
+
+        radius = (size + 1) / 2
+        cx, cy = x + radius, y + radius
+        xs = np.arange(x0, x1, dtype=np.float32) + 0.5 - cx
+        ys = np.arange(y0, y1, dtype=np.float32)[:, None] + 0.5 - cy
+        distance = np.sqrt(xs * xs + ys * ys)
+
+        # Logistic edge with the same spread as a Gaussian blur of the disc
+        coverage = 1 / (1 + np.exp((distance - radius) / (CIRCLE_EDGE_SCALE * CIRCLE_BLUR_RADIUS)))
+
+        # The blurred layer is un-premultiplied, so both its colour and its
+        # alpha fade with coverage
+        weight = (coverage * (alpha / 255))[:, :, None]
+        region = pixels[y0:y1, x0:x1].astype(np.float32)
+        region += (255 * coverage[:, :, None] - region) * weight
+        pixels[y0:y1, x0:x1] = np.rint(region).astype(np.uint8)
+
+    def generate_bold_template(
         self,
         text: str,
         background_image: Optional[Path] = None,
@@ -148,13 +267,15 @@ class ThumbnailGenerator:
         lines = self._wrap_text(text, font, max_width)
 
         # Calculate total text height
-        total_height = sum([font.getbbox(line)[3] - font.getbbox(line)[1] for line in lines])
+        total_height = sum(
+            bbox[3] - bbox[1] for bbox in (_measure_text(font, line) for line in lines)
+        )
         total_height += (len(lines) - 1) * 20  # Line spacing
 
         y = (self.height - total_height) // 2
 
         for line in lines:
-            bbox = font.getbbox(line)
+            bbox = _measure_text(font, line)
             text_width = bbox[2] - bbox[0]
             text_height = bbox[3] - bbox[1]
             x = (self.width - text_width) // 2
@@ -170,7 +291,7 @@ class ThumbnailGenerator:
 
         return img
 
-    async def generate_minimal_template(
+    def generate_minimal_template(
         self,
         text: str,
         background_image: Optional[Path] = None,
@@ -191,11 +312,12 @@ class ThumbnailGenerator:
         else:
             img = Image.new("RGB", (self.width, self.height), (245, 245, 250))
 
-        draw = ImageDraw.Draw(img)
+        # Add semi-transparent white overlay as a per-channel lookup
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+        img = img.point(_MINIMAL_OVERLAY_LUT)
 
-        # Add semi-transparent overlay
-        overlay = Image.new("RGBA", (self.width, self.height), (255, 255, 255, 200))
-        img.paste(overlay, (0, 0), overlay)
+        draw = ImageDraw.Draw(img)
 
         # Add text
         font = self._get_font(70)
@@ -204,13 +326,15 @@ class ThumbnailGenerator:
         lines = self._wrap_text(text, font, max_width)
 
         # Calculate position
-        total_height = sum([font.getbbox(line)[3] - font.getbbox(line)[1] for line in lines])
+        total_height = sum(
+            bbox[3] - bbox[1] for bbox in (_measure_text(font, line) for line in lines)
+        )
         total_height += (len(lines) - 1) * 15
 
         y = (self.height - total_height) // 2
 
         for line in lines:
-            bbox = font.getbbox(line)
+            bbox = _measure_text(font, line)
             text_width = bbox[2] - bbox[0]
             text_height = bbox[3] - bbox[1]
             x = (self.width - text_width) // 2
@@ -222,7 +346,7 @@ class ThumbnailGenerator:
 
         return img
 
-    async def generate_colorful_template(
+    def generate_colorful_template(
         self,
         text: str,
         background_image: Optional[Path] = None,
@@ -247,21 +371,18 @@ class ThumbnailGenerator:
         color_pair = random.choice(colors)
         img = self._create_gradient_background(color_pair[0], color_pair[1])
 
-        draw = ImageDraw.Draw(img)
-
         # Add decorative elements
+        pixels = np.array(img)
         for _ in range(10):
             x = random.randint(0, self.width)
             y = random.randint(0, self.height)
             size = random.randint(50, 150)
             alpha = random.randint(30, 80)
-            color = (255, 255, 255, alpha)
 
-            circle_img = Image.new("RGBA", (self.width, self.height), (0, 0, 0, 0))
-            circle_draw = ImageDraw.Draw(circle_img)
-            circle_draw.ellipse([x, y, x + size, y + size], fill=color)
-            circle_img = circle_img.filter(ImageFilter.GaussianBlur(radius=20))
-            img.paste(circle_img, (0, 0), circle_img)
+            self._blend_soft_circle(pixels, x, y, size, alpha)
+
+        img = Image.fromarray(pixels, "RGB")
+        draw = ImageDraw.Draw(img)
 
         # Add text
         font = self._get_font(85)
@@ -269,37 +390,39 @@ class ThumbnailGenerator:
 
         lines = self._wrap_text(text, font, max_width)
 
-        total_height = sum([font.getbbox(line)[3] - font.getbbox(line)[1] for line in lines])
+        total_height = sum(
+            bbox[3] - bbox[1] for bbox in (_measure_text(font, line) for line in lines)
+        )
         total_height += (len(lines) - 1) * 18
 
         y = (self.height - total_height) // 2
 
         for line in lines:
-            bbox = font.getbbox(line)
+            bbox = _measure_text(font, line)
             text_width = bbox[2] - bbox[0]
             text_height = bbox[3] - bbox[1]
             x = (self.width - text_width) // 2
 
-            # Draw text with strong shadow
+            # Draw text with strong shadow, blending each layer through a
+            # text-sized mask instead of a full-frame RGBA overlay
             for offset in range(6, 0, -1):
                 alpha = int(255 * (1 - offset / 6))
-                shadow_color = (0, 0, 0, alpha)
-                shadow_img = Image.new("RGBA", (self.width, self.height), (0, 0, 0, 0))
-                shadow_draw = ImageDraw.Draw(shadow_img)
-                shadow_draw.text((x + offset, y + offset), line, font=font, fill=shadow_color)
-                img.paste(shadow_img, (0, 0), shadow_img)
+                shadow_mask = Image.new("L", (text_width, text_height), 0)
+                ImageDraw.Draw(shadow_mask).text(
+                    (-bbox[0], -bbox[1]), line, font=font, fill=alpha
+                )
+                img.paste(
+                    (0, 0, 0), (x + offset + bbox[0], y + offset + bbox[1]), shadow_mask
+                )
 
             # Draw main text
-            text_img = Image.new("RGBA", (self.width, self.height), (0, 0, 0, 0))
-            text_draw = ImageDraw.Draw(text_img)
-            text_draw.text((x, y), line, font=font, fill=(255, 255, 255))
-            img.paste(text_img, (0, 0), text_img)
+            draw.text((x, y), line, font=font, fill=(255, 255, 255))
 
             y += text_height + 18
 
         return img
 
-    async def generate_tech_template(
+    def generate_tech_template(
         self,
         text: str,
         background_image: Optional[Path] = None,
@@ -332,31 +455,35 @@ class ThumbnailGenerator:
 
         lines = self._wrap_text(text, font, max_width)
 
-        total_height = sum([font.getbbox(line)[3] - font.getbbox(line)[1] for line in lines])
+        total_height = sum(
+            bbox[3] - bbox[1] for bbox in (_measure_text(font, line) for line in lines)
+        )
         total_height += (len(lines) - 1) * 16
 
         y = (self.height - total_height) // 2
 
         for line in lines:
-            bbox = font.getbbox(line)
+            bbox = _measure_text(font, line)
             text_width = bbox[2] - bbox[0]
             text_height = bbox[3] - bbox[1]
             x = (self.width - text_width) // 2
 
-            # Draw neon glow effect
+            # Draw neon glow effect on a canvas just large enough for the
+            # line plus the blur spread
             for i in range(5, 0, -1):
+                radius = i * 2
+                pad = BLUR_PAD_PER_RADIUS * radius
                 glow_color = (52, 152, 219, int(255 * (1 - i / 5)))
-                glow_img = Image.new("RGBA", (self.width, self.height), (0, 0, 0, 0))
+                glow_img = Image.new(
+                    "RGBA", (text_width + 2 * pad, text_height + 2 * pad), (0, 0, 0, 0)
+                )
                 glow_draw = ImageDraw.Draw(glow_img)
-                glow_draw.text((x, y), line, font=font, fill=glow_color)
-                glow_img = glow_img.filter(ImageFilter.GaussianBlur(radius=i * 2))
-                img.paste(glow_img, (0, 0), glow_img)
+                glow_draw.text((pad - bbox[0], pad - bbox[1]), line, font=font, fill=glow_color)
+                glow_img = glow_img.filter(ImageFilter.GaussianBlur(radius=radius))
+                img.paste(glow_img, (x + bbox[0] - pad, y + bbox[1] - pad), glow_img)
 
             # Draw main text
-            text_img = Image.new("RGBA", (self.width, self.height), (0, 0, 0, 0))
-            text_draw = ImageDraw.Draw(text_img)
-            text_draw.text((x, y), line, font=font, fill=(255, 255, 255))
-            img.paste(text_img, (0, 0), text_img)
+            draw.text((x, y), line, font=font, fill=(255, 255, 255))
 
             y += text_height + 16
 
@@ -371,6 +498,30 @@ class ThumbnailGenerator:
     ) -> Path:
         """Generate thumbnail with specified template.
 
+        Rendering runs in a worker thread so it does not block the event loop.
+
+        Args:
+            text: Thumbnail text
+            output_path: Output file path
+            template: Template name (bold, minimal, colorful, tech)
+            background_image: Optional background image
+
+        Returns:
+            Path to generated thumbnail
+        """
+        return await asyncio.to_thread(
+            self._render_thumbnail, text, output_path, template, background_image
+        )
+
+    def _render_thumbnail(
+        self,
+        text: str,
+        output_path: Path,
+        template: str,
+        background_image: Optional[Path],
+    ) -> Path:
+        """Render and save a thumbnail with the specified template.
+
         Args:
             text: Thumbnail text
             output_path: Output file path
@@ -385,16 +536,16 @@ class ThumbnailGenerator:
         try:
             # Generate based on template
             if template == "bold":
-                img = await self.generate_bold_template(text, background_image)
+                img = self.generate_bold_template(text, background_image)
             elif template == "minimal":
-                img = await self.generate_minimal_template(text, background_image)
+                img = self.generate_minimal_template(text, background_image)
             elif template == "colorful":
-                img = await self.generate_colorful_template(text, background_image)
+                img = self.generate_colorful_template(text, background_image)
             elif template == "tech":
-                img = await self.generate_tech_template(text, background_image)
+                img = self.generate_tech_template(text, background_image)
             else:
                 logger.warning(f"Unknown template: {template}, using bold")
-                img = await self.generate_bold_template(text, background_image)
+                img = self.generate_bold_template(text, background_image)
 
             # Ensure output directory exists
             ensure_directory(output_path.parent)
@@ -402,11 +553,17 @@ class ThumbnailGenerator:
             # Convert to RGB if needed
             if img.mode == "RGBA":
                 rgb_img = Image.new("RGB", img.size, (255, 255, 255))
-                rgb_img.paste(img, mask=img.split()[3])
+                rgb_img.paste(img, mask=img.getchannel("A"))
                 img = rgb_img
 
             # Save thumbnail
-            img.save(output_path, "JPEG", quality=95, optimize=True)
+            img.save(
+                output_path,
+                "JPEG",
+                quality=THUMBNAIL_JPEG_QUALITY,
+                subsampling=2,
+                progressive=False,
+            )
 
             logger.info(f"Thumbnail generated: {output_path}")
             return output_path
@@ -432,14 +589,14 @@ class ThumbnailGenerator:
             List of generated thumbnail paths
         """
         ensure_directory(output_dir)
-        thumbnails = []
 
-        for template in self.templates:
-            output_path = output_dir / f"thumbnail_{template}.jpg"
-            thumbnail = await self.generate_thumbnail(
-                text, output_path, template, background_image
+        # Templates are independent, so render them concurrently
+        thumbnails = await asyncio.gather(*[
+            self.generate_thumbnail(
+                text, output_dir / f"thumbnail_{template}.jpg", template, background_image
             )
-            thumbnails.append(thumbnail)
+            for template in self.templates
+        ])
 
         logger.info(f"Generated {len(thumbnails)} thumbnail variants")
-        return thumbnails
+        return list(thumbnails)
@@ -1,10 +1,13 @@
 """YouTube video upload module."""
 
+import asyncio
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
+import httplib2
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaFileUpload
@@ -17,6 +20,15 @@ settings = get_settings()
 
 SCOPES = ["https://www.googleapis.com/auth/youtube.upload"]
 
+# Resumable upload tuning: files below the threshold go up in a single
+# request, larger files in 8MB chunks
+SINGLE_REQUEST_UPLOAD_LIMIT = 50 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+UPLOAD_NUM_RETRIES = 5
+
+# Maximum number of video IDs accepted by a single videos.list call
+MAX_VIDEO_IDS_PER_REQUEST = 50
+
 
 class YouTubeUploader:
     """Upload videos to YouTube."""
@@ -122,10 +134,15 @@ class YouTubeUploader:
             if publish_at and privacy_status == "private":
                 body["status"]["publishAt"] = publish_at.isoformat()
 
-            # Create media upload
+            # Create media upload (-1 uploads the whole file in one request)
+            if video_path.stat().st_size < SINGLE_REQUEST_UPLOAD_LIMIT:
+                chunksize = -1
+            else:
+                chunksize = UPLOAD_CHUNK_SIZE
+
             media = MediaFileUpload(
                 str(video_path),
-                chunksize=1024 * 1024,  # 1MB chunks
+                chunksize=chunksize,
                 resumable=True,
                 mimetype="video/*",
             )
@@ -138,12 +155,8 @@ class YouTubeUploader:
                 media_body=media,
             )
 
-            response = None
-            while response is None:
-                status, response = request.next_chunk()
-                if status:
-                    progress = int(status.progress() * 100)
-                    logger.info(f"Upload progress: {progress}%")
+            # Drive the blocking upload loop in a worker thread
+            response = await asyncio.to_thread(self._drive_upload, request)
 
             video_id = response["id"]
             video_url = f"https://www.youtube.com/watch?v={video_id}"
@@ -178,10 +191,11 @@ class YouTubeUploader:
         try:
             media = MediaFileUpload(str(thumbnail_path), mimetype="image/jpeg")
 
-            self.youtube.thumbnails().set(
+            request = self.youtube.thumbnails().set(
                 videoId=video_id,
                 media_body=media,
-            ).execute()
+            )
+            await asyncio.to_thread(request.execute, http=self._new_http())
 
             logger.info(f"Thumbnail set for video {video_id}")
             return True
@@ -203,24 +217,17 @@ class YouTubeUploader:
             raise ValueError("YouTube client not initialized")
 
         try:
-            response = self.youtube.videos().list(
+            request = self.youtube.videos().list(
                 part="statistics,contentDetails",
                 id=video_id,
-            ).execute()
+            )
+            response = await asyncio.to_thread(request.execute, http=self._new_http())
 
             if not response.get("items"):
                 logger.warning(f"Video not found: {video_id}")
                 return {}
 
-            item = response["items"][0]
-            stats = item.get("statistics", {})
-
-            analytics = {
-                "views": int(stats.get("viewCount", 0)),
-                "likes": int(stats.get("likeCount", 0)),
-                "comments": int(stats.get("commentCount", 0)),
-                "duration": item.get("contentDetails", {}).get("duration", ""),
-            }
+            analytics = self._parse_analytics(response["items"][0])
 
             logger.info(f"Retrieved analytics for video {video_id}")
             return analytics
@@ -228,3 +235,86 @@ class YouTubeUploader:
         except Exception as e:
             logger.error(f"Error getting video analytics: {e}")
             return {}
+
+    async def get_videos_analytics(self, video_ids: List[str]) -> Dict[str, Dict]:
+        """Get analytics data for multiple videos.
+
+        Video IDs are requested in batches of up to 50 per API call.
+
+        Args:
+            video_ids: List of YouTube video IDs
+
+        Returns:
+            Dictionary mapping video ID to analytics data
+        """
+        if not self.youtube:
+            raise ValueError("YouTube client not initialized")
+
+        analytics = {}
+
+        for start in range(0, len(video_ids), MAX_VIDEO_IDS_PER_REQUEST):
+            batch = video_ids[start:start + MAX_VIDEO_IDS_PER_REQUEST]
+
+            try:
+                request = self.youtube.videos().list(
+                    part="statistics,contentDetails",
+                    id=",".join(batch),
+                )
+                response = await asyncio.to_thread(request.execute, http=self._new_http())
+
+                for item in response.get("items", []):
+                    analytics[item["id"]] = self._parse_analytics(item)
+
+            except Exception as e:
+                logger.error(f"Error getting analytics for {len(batch)} videos: {e}")
+
+        logger.info(f"Retrieved analytics for {len(analytics)}/{len(video_ids)} videos")
+        return analytics
+
+    def _new_http(self) -> AuthorizedHttp:
+        """Create an authorized HTTP transport for a single worker-thread call.
+
+        httplib2 connections are not thread-safe, so requests executed via
+        asyncio.to_thread each get their own transport.
+
+        Returns:
+            Authorized HTTP transport
+        """
+        return AuthorizedHttp(self.credentials, http=httplib2.Http())
+
+    def _drive_upload(self, request) -> Dict:
+        """Send all chunks of a resumable upload (blocking).
+
+        Args:
+            request: videos.insert request with a resumable media body
+
+        Returns:
+            API response for the uploaded video
+        """
+        http = self._new_http()
+        response = None
+        while response is None:
+            status, response = request.next_chunk(http=http, num_retries=UPLOAD_NUM_RETRIES)
+            if status:
+                progress = int(status.progress() * 100)
+                logger.info(f"Upload progress: {progress}%")
+
+        return response
+
+    def _parse_analytics(self, item: Dict) -> Dict:
+        """Extract analytics fields from a videos.list item.
+
+        Args:
+            item: Video resource from the YouTube API
+
+        Returns:
+            Dictionary with analytics data
+        """
+        stats = item.get("statistics", {})
+
+        return {
+            "views": int(stats.get("viewCount", 0)),
+            "likes": int(stats.get("likeCount", 0)),
+            "comments": int(stats.get("commentCount", 0)),
+            "duration": item.get("contentDetails", {}).get("duration", ""),
+        }
@@ -1,12 +1,51 @@
 """Utility helper functions."""
 
 import hashlib
+import os
 import re
-from datetime import datetime, timedelta
+import time
+import unicodedata
+from collections import Counter
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional, Set, Union
 from urllib.parse import urlparse
 
+# Maximum sanitized filename length in UTF-8 bytes, leaving room for a suffix
+# and extension under the usual 255-byte filesystem limit
+MAX_FILENAME_BYTES = 200
+
+# Characters removed by sanitize_filename
+_INVALID_FILENAME_CHARS = str.maketrans("", "", '<>:"/\\|?*')
+
+_WORD_RE = re.compile(r"\w+")
+
+# A URL scheme followed by a non-empty network location; leading control
+# characters and spaces are ignored, as urlparse strips them
+_URL_RE = re.compile(r"[\x00-\x20]*[A-Za-z][A-Za-z0-9+.\-]*://[^/?#]")
+
+# Characters _URL_RE does not handle like urlparse: tabs and newlines are
+# removed anywhere in the URL and brackets delimit IPv6 hosts
+_URL_SLOW_PATH_RE = re.compile(r"[\t\r\n\[\]]")
+
+# Directories already created or verified by ensure_directory
+_ENSURED_DIRECTORIES: Set[str] = set()
+
+# Time spans used by time_ago, in seconds
+_MINUTE = 60
+_HOUR = 3600
+_DAY = 86400
+_MONTH = 30 * _DAY
+_YEAR = 365 * _DAY
+
+# Common Japanese stop words ignored by extract_keywords
+STOP_WORDS = frozenset({
+    "の", "に", "は", "を", "た", "が", "で", "て", "と", "し", "れ", "さ",
+    "ある", "いる", "も", "する", "から", "な", "こと", "として", "い",
+    "や", "れる", "など", "なっ", "ない", "この", "ため", "その", "あっ",
+    "よう", "また", "もの", "という", "あり", "まで", "られ", "なる",
+})
+
 
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename by removing invalid characters.
@@ -18,25 +57,43 @@ def sanitize_filename(filename: str) -> str:
         Sanitized filename
     """
     # Remove invalid characters
-    filename = re.sub(r'[<>:"/\\|?*]', "", filename)
+    filename = filename.translate(_INVALID_FILENAME_CHARS)
     # Replace spaces with underscores
     filename = filename.replace(" ", "_")
-    # Limit length
-    if len(filename) > 200:
-        filename = filename[:200]
+    # Limit length in UTF-8 bytes; only strings that could exceed the budget
+    # (up to 4 bytes per character) need encoding
+    if len(filename) * 4 > MAX_FILENAME_BYTES:
+        encoded = filename.encode("utf-8")
+        if len(encoded) > MAX_FILENAME_BYTES:
+            # Drop any character cut in half at the boundary
+            filename = encoded[:MAX_FILENAME_BYTES].decode("utf-8", errors="ignore")
     return filename
 
 
-def generate_hash(text: str) -> str:
+def generate_hash(text: Union[str, bytes]) -> str:
     """Generate SHA256 hash of text.
 
     Args:
-        text: Input text
+        text: Input text (bytes are hashed as-is)
+
+    Returns:
+        Hexadecimal hash string
+    """
+    data = text.encode("utf-8") if isinstance(text, str) else text
+    return hashlib.sha256(data, usedforsecurity=False).hexdigest()
+
+
+def generate_hash_file(path: Path) -> str:
+    """Generate SHA256 hash of a file's contents without loading it whole.
+
+    Args:
+        path: File path
 
     Returns:
         Hexadecimal hash string
     """
-    return hashlib.sha256(text.encode()).hexdigest()
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
 
 def is_valid_url(url: str) -> bool:
@@ -48,6 +105,9 @@ def is_valid_url(url: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
+    if isinstance(url, str) and url.isascii() and not _URL_SLOW_PATH_RE.search(url):
+        return _URL_RE.match(url) is not None
+
     try:
         result = urlparse(url)
         return all([result.scheme, result.netloc])
@@ -80,47 +140,50 @@ def time_ago(dt: datetime) -> str:
     Returns:
         Human-readable time ago string
     """
-    now = datetime.utcnow()
-    diff = now - dt
+    # Naive datetimes are interpreted as UTC
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    seconds = int(time.time() - dt.timestamp())
 
-    if diff < timedelta(minutes=1):
+    if seconds < _MINUTE:
         return "just now"
-    elif diff < timedelta(hours=1):
-        minutes = int(diff.total_seconds() / 60)
+    elif seconds < _HOUR:
+        minutes = seconds // _MINUTE
         return f"{minutes} minute{'s' if minutes > 1 else ''} ago"
-    elif diff < timedelta(days=1):
-        hours = int(diff.total_seconds() / 3600)
+    elif seconds < _DAY:
+        hours = seconds // _HOUR
         return f"{hours} hour{'s' if hours > 1 else ''} ago"
-    elif diff < timedelta(days=30):
-        days = diff.days
+    elif seconds < _MONTH:
+        days = seconds // _DAY
         return f"{days} day{'s' if days > 1 else ''} ago"
-    elif diff < timedelta(days=365):
-        months = int(diff.days / 30)
+    elif seconds < _YEAR:
+        months = seconds // _MONTH
         return f"{months} month{'s' if months > 1 else ''} ago"
     else:
-        years = int(diff.days / 365)
+        years = seconds // _YEAR
         return f"{years} year{'s' if years > 1 else ''} ago"
 
 
-def chunk_text(text: str, max_length: int = 1000) -> List[str]:
+def chunk_text(text: str, max_length: int = 1000) -> Iterator[str]:
     """Split text into chunks of maximum length.
 
+    Chunks are yielded as soon as they are complete so long inputs can be
+    streamed; wrap the call in ``list()`` when a list is needed.
+
     Args:
         text: Input text
         max_length: Maximum length per chunk
 
-    Returns:
-        List of text chunks
+    Yields:
+        Text chunks
     """
-    chunks = []
-    words = text.split()
-    current_chunk = []
+    current_chunk: List[str] = []
     current_length = 0
 
-    for word in words:
+    for word in text.split():
         word_length = len(word) + 1  # +1 for space
         if current_length + word_length > max_length:
-            chunks.append(" ".join(current_chunk))
+            yield " ".join(current_chunk)
             current_chunk = [word]
             current_length = word_length
         else:
@@ -128,21 +191,24 @@ def chunk_text(text: str, max_length: int = 1000) -> List[str]:
             current_length += word_length
 
     if current_chunk:
-        chunks.append(" ".join(current_chunk))
-
-    return chunks
+        yield " ".join(current_chunk)
 
 
 def ensure_directory(path: Path) -> Path:
     """Ensure directory exists, create if not.
 
+    Directories already ensured by this process are not checked again.
+
     Args:
         path: Directory path
 
     Returns:
         Path object
     """
-    path.mkdir(parents=True, exist_ok=True)
+    key = os.fspath(path)
+    if key not in _ENSURED_DIRECTORIES:
+        path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRECTORIES.add(key)
     return path
 
 
@@ -178,7 +244,30 @@ def truncate_text(text: str, max_length: int, suffix: str = "...") -> str:
     """
     if len(text) <= max_length:
         return text
-    return text[: max_length - len(suffix)] + suffix
+
+    # Back off so combining marks, variation selectors and ZWJ sequences
+    # are not split from their base character
+    end = max_length - len(suffix)
+    while end > 0 and (_is_cluster_continuation(text[end]) or text[end - 1] == "\u200d"):
+        end -= 1
+    return text[:end] + suffix
+
+
+def _is_cluster_continuation(char: str) -> bool:
+    """Check if a character continues the preceding grapheme cluster.
+
+    Args:
+        char: Single character
+
+    Returns:
+        True if the character must stay attached to the previous one
+    """
+    return (
+        unicodedata.combining(char) != 0
+        or char == "\u200d"
+        or "\ufe00" <= char <= "\ufe0f"
+        or "\U0001f3fb" <= char <= "\U0001f3ff"
+    )
 
 
 def extract_keywords(text: str, max_keywords: int = 10) -> List[str]:
@@ -191,22 +280,12 @@ def extract_keywords(text: str, max_keywords: int = 10) -> List[str]:
     Returns:
         List of keywords
     """
-    # Remove common Japanese stop words and punctuation
-    stop_words = {
-        "の", "に", "は", "を", "た", "が", "で", "て", "と", "し", "れ", "さ",
-        "ある", "いる", "も", "する", "から", "な", "こと", "として", "い",
-        "や", "れる", "など", "なっ", "ない", "この", "ため", "その", "あっ",
-        "よう", "また", "もの", "という", "あり", "まで", "られ", "なる",
-    }
-
     # Simple word extraction (in real implementation, use morphological analysis)
-    words = re.findall(r"\w+", text.lower())
-    word_freq = {}
-
-    for word in words:
-        if len(word) > 1 and word not in stop_words:
-            word_freq[word] = word_freq.get(word, 0) + 1
-
-    # Sort by frequency
-    sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-    return [word for word, _ in sorted_words[:max_keywords]]
+    word_freq = Counter(
+        word
+        for word in _WORD_RE.findall(text.lower())
+        if len(word) > 1 and word not in STOP_WORDS
+    )
+
+    # Most frequent first
+    return [word for word, _ in word_freq.most_common(max_keywords)]
@@ -1,5 +1,9 @@
 """Video editing and generation module."""
 
+import asyncio
+import os
+import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Tuple
 from dataclasses import dataclass
@@ -7,6 +11,7 @@ from dataclasses import dataclass
 import numpy as np
 from moviepy.editor import (
     VideoClip,
+    VideoFileClip,
     ImageClip,
     AudioFileClip,
     TextClip,
@@ -14,16 +19,108 @@ from moviepy.editor import (
     concatenate_videoclips,
     ColorClip,
 )
+from moviepy.config import get_setting
 from moviepy.video.fx import fadein, fadeout
 from PIL import Image, ImageDraw, ImageFont
 
 from src.core.config import get_settings
 from src.core.logging import get_logger
-from src.utils.helpers import ensure_directory
+from src.utils.helpers import ensure_directory, generate_hash
 
 logger = get_logger(__name__)
 settings = get_settings()
 
+# Software H.264 encoder, used when no hardware encoder works
+SOFTWARE_ENCODER = "libx264"
+
+# Hardware H.264 encoders tried in order when VIDEO_CODEC is "auto"
+HARDWARE_ENCODERS = ["h264_nvenc", "h264_qsv"]
+
+# Encoder presets passed to FFmpeg, and extra encoder arguments. MoviePy only
+# forces yuv420p for libx264; hardware encoders would otherwise pick their own
+# pixel format, which many players and YouTube handle poorly
+ENCODER_PRESETS = {
+    "libx264": "medium",
+    "h264_nvenc": "p4",
+    "h264_qsv": "medium",
+}
+ENCODER_PARAMS = {
+    "h264_nvenc": ["-rc", "vbr", "-cq", "23", "-pix_fmt", "yuv420p"],
+    "h264_qsv": ["-pix_fmt", "yuv420p"],
+}
+
+# Keyframe interval of rendered videos, in seconds
+GOP_SECONDS = 2
+
+# Rendered outro clips, reused across videos; a cache hit refreshes the
+# file's mtime so cleanup_old_files only drops clips that stop being used
+CLIP_CACHE_PATH = settings.cache_path / "clips"
+
+# Near-lossless settings for cached clips, which are re-encoded into the video
+CLIP_CACHE_PARAMS = ["-crf", "12"]
+
+OUTRO_TEXT = "チャンネル登録をお願いします！"
+
+# Candidate caption fonts, tried in order; CJK fonts first so Japanese
+# captions render
+CAPTION_FONT_PATHS = [
+    "/usr/share/fonts/opentype/noto/NotoSansCJK-Bold.ttc",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+    "/System/Library/Fonts/Hiragino Sans GB.ttc",
+    "C:\\Windows\\Fonts\\meiryo.ttc",
+]
+
+# Caption box styling: translucent black behind white text
+CAPTION_BACKGROUND = (0, 0, 0, 128)
+CAPTION_PADDING = 10
+CAPTION_LINE_SPACING = 6
+
+
+@lru_cache(maxsize=None)
+def _encoder_works(codec: str) -> bool:
+    """Check that FFmpeg can encode with a codec on this machine.
+
+    A build may list a hardware encoder without the device being present,
+    so this runs a tiny test encode instead of reading ``ffmpeg -encoders``.
+
+    Args:
+        codec: FFmpeg encoder name
+
+    Returns:
+        True if the test encode succeeded
+    """
+    command = [
+        get_setting("FFMPEG_BINARY"),
+        "-hide_banner",
+        "-loglevel", "error",
+        "-f", "lavfi",
+        "-i", "color=c=black:s=256x256:d=0.1",
+        "-c:v", codec,
+        "-f", "null",
+        "-",
+    ]
+    try:
+        result = subprocess.run(command, capture_output=True, timeout=30)
+    except (OSError, subprocess.SubprocessError):
+        return False
+    return result.returncode == 0
+
+
+def select_video_codec() -> str:
+    """Select the H.264 encoder for rendering videos.
+
+    Returns:
+        Configured codec, or the first working hardware encoder when set to
+        "auto", falling back to libx264
+    """
+    if settings.video_codec != "auto":
+        return settings.video_codec
+
+    for codec in HARDWARE_ENCODERS:
+        if _encoder_works(codec):
+            return codec
+    return SOFTWARE_ENCODER
+
 
 @dataclass
 class VideoScene:
@@ -35,6 +132,176 @@ class VideoScene:
     transition: str = "fade"
 
 
+@lru_cache(maxsize=16)
+def _load_caption_font(size: int) -> ImageFont.FreeTypeFont:
+    """Load the first available caption font, cached per size.
+
+    Args:
+        size: Font size
+
+    Returns:
+        Font object
+    """
+    for font_path in CAPTION_FONT_PATHS:
+        try:
+            return ImageFont.truetype(font_path, size)
+        except Exception:
+            continue
+
+    logger.warning("No caption font found, using default")
+    return ImageFont.load_default(size)
+
+
+def _wrap_caption(text: str, font: ImageFont.FreeTypeFont, max_width: int) -> List[str]:
+    """Wrap text to fit within a width.
+
+    Words are kept whole where possible; text without spaces (such as
+    Japanese) or words wider than a line are broken between characters.
+
+    Args:
+        text: Text to wrap
+        font: Font to measure with
+        max_width: Maximum line width in pixels
+
+    Returns:
+        Wrapped lines
+    """
+    lines = []
+    line = ""
+    for word in text.split(" "):
+        candidate = f"{line} {word}" if line else word
+        if font.getlength(candidate) <= max_width:
+            line = candidate
+            continue
+
+        if line:
+            lines.append(line)
+            line = ""
+        for char in word:
+            if line and font.getlength(line + char) > max_width:
+                lines.append(line)
+                line = ""
+            line += char
+
+    if line:
+        lines.append(line)
+    return lines
+
+
+def _render_caption(text: str, width: int, fontsize: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Rasterize a caption box.
+
+    Args:
+        text: Caption text
+        width: Box width in pixels
+        fontsize: Font size
+
+    Returns:
+        Tuple of (RGB pixels, opacity in [0, 1]); both are read-only
+    """
+    font = _load_caption_font(fontsize)
+    lines = _wrap_caption(text, font, width - 2 * CAPTION_PADDING)
+    ascent, descent = font.getmetrics()
+    line_height = ascent + descent
+    height = (
+        2 * CAPTION_PADDING
+        + len(lines) * line_height
+        + (len(lines) - 1) * CAPTION_LINE_SPACING
+    )
+
+    img = Image.new("RGBA", (width, height), CAPTION_BACKGROUND)
+    draw = ImageDraw.Draw(img)
+    y = CAPTION_PADDING
+    for line in lines:
+        x = (width - font.getlength(line)) / 2
+        draw.text((x, y), line, font=font, fill=(255, 255, 255, 255))
+        y += line_height + CAPTION_LINE_SPACING
+
+    pixels = np.asarray(img)
+    rgb = np.ascontiguousarray(pixels[:, :, :3])
+    alpha = pixels[:, :, 3] / np.float32(255)
+    rgb.setflags(write=False)
+    alpha.setflags(write=False)
+    return rgb, alpha
+
+
+def _rasterize_text(
+    text: str,
+    fontsize: int,
+    color: str,
+    font: str,
+    width: Optional[int] = None,
+    method: str = "label",
+) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """Rasterize text with TextClip.
+
+    Args:
+        text: Text to render
+        fontsize: Font size
+        color: Text color
+        font: ImageMagick font name
+        width: Optional box width; text is wrapped to it with method "caption"
+        method: TextClip rendering method ("label" or "caption")
+
+    Returns:
+        Tuple of (RGB pixels, opacity mask or None); both are read-only
+    """
+    clip = TextClip(
+        text,
+        fontsize=fontsize,
+        color=color,
+        font=font,
+        size=(width, None) if width else None,
+        method=method,
+    )
+    try:
+        pixels = clip.get_frame(0)
+        mask = clip.mask.get_frame(0) if clip.mask is not None else None
+    finally:
+        clip.close()
+
+    pixels.setflags(write=False)
+    if mask is not None:
+        mask.setflags(write=False)
+    return pixels, mask
+
+
+# TextClip runs ImageMagick on every call, so constant texts such as the outro
+# message reuse their first rendering; per-video text is never cached
+_render_text = lru_cache(maxsize=4)(_rasterize_text)
+
+
+def _text_clip(
+    text: str,
+    fontsize: int,
+    color: str,
+    font: str,
+    width: Optional[int] = None,
+    method: str = "label",
+    cache: bool = True,
+) -> VideoClip:
+    """Create a text clip, reusing cached renderings of constant text.
+
+    Args:
+        text: Text to render
+        fontsize: Font size
+        color: Text color
+        font: ImageMagick font name
+        width: Optional box width; text is wrapped to it with method "caption"
+        method: TextClip rendering method ("label" or "caption")
+        cache: Whether to cache the rendering; False for per-video text
+
+    Returns:
+        Image clip with the rendered text and its transparency mask
+    """
+    render = _render_text if cache else _rasterize_text
+    pixels, mask = render(text, fontsize, color, font, width, method)
+    clip = ImageClip(pixels)
+    if mask is not None:
+        clip = clip.set_mask(ImageClip(mask, ismask=True))
+    return clip
+
+
 class VideoEditor:
     """Video editor for creating YouTube videos."""
 
@@ -42,6 +309,8 @@ class VideoEditor:
         """Initialize video editor."""
         self.width, self.height = self._parse_resolution(settings.video_resolution)
         self.fps = settings.video_fps
+        self.codec = select_video_codec()
+        logger.info(f"Using video encoder: {self.codec}")
 
     def _parse_resolution(self, resolution: str) -> Tuple[int, int]:
         """Parse resolution string to width and height.
@@ -55,6 +324,69 @@ class VideoEditor:
         parts = resolution.split("x")
         return int(parts[0]), int(parts[1])
 
+    def _clip_cache_path(self, *parts: object) -> Path:
+        """Get the cache file for a rendered clip.
+
+        Args:
+            *parts: Values that determine the clip's content
+
+        Returns:
+            Path to the cached clip, which may not exist yet
+        """
+        key = "|".join(str(part) for part in (*parts, self.width, self.height, self.fps))
+        return CLIP_CACHE_PATH / f"{generate_hash(key)}.mp4"
+
+    def _load_cached_clip(self, path: Path) -> Optional[VideoClip]:
+        """Load a previously rendered clip from the cache.
+
+        Args:
+            path: Cached clip path
+
+        Returns:
+            Video clip, or None on a cache miss
+        """
+        if not path.exists():
+            return None
+
+        try:
+            path.touch()
+            return VideoFileClip(str(path), audio=False)
+        except Exception as e:
+            logger.warning(f"Failed to load cached clip {path}: {e}")
+            return None
+
+    def _cache_clip(self, clip: VideoClip, path: Path) -> VideoClip:
+        """Render a clip into the cache and return the cached copy.
+
+        Args:
+            clip: Clip to render
+            path: Cached clip path
+
+        Returns:
+            Cached clip, or the original clip if rendering failed
+        """
+        ensure_directory(path.parent)
+        # Render under a temporary name so readers never see a partial file
+        tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.tmp.mp4")
+        try:
+            clip.write_videofile(
+                str(tmp_path),
+                fps=self.fps,
+                codec=SOFTWARE_ENCODER,
+                audio=False,
+                preset="ultrafast",
+                ffmpeg_params=CLIP_CACHE_PARAMS,
+                logger=None,
+            )
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Failed to cache clip {path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return clip
+
+        clip.close()
+        return VideoFileClip(str(path), audio=False)
+
     async def create_intro(
         self,
         title: str,
@@ -62,6 +394,21 @@ class VideoEditor:
     ) -> VideoClip:
         """Create intro clip with title.
 
+        Args:
+            title: Video title
+            duration: Intro duration in seconds
+
+        Returns:
+            Intro video clip
+        """
+        return await asyncio.to_thread(self._render_intro, title, duration)
+
+    def _render_intro(self, title: str, duration: float) -> VideoClip:
+        """Build the intro clip.
+
+        Nothing is cached: titles are unique per video, so neither an encoded
+        clip nor the title raster would ever be reused.
+
         Args:
             title: Video title
             duration: Intro duration in seconds
@@ -78,13 +425,14 @@ class VideoEditor:
 
         # Create title text
         try:
-            title_clip = TextClip(
+            title_clip = _text_clip(
                 title,
                 fontsize=70,
                 color="white",
                 font="Arial-Bold",
-                size=(self.width - 200, None),
+                width=self.width - 200,
                 method="caption",
+                cache=False,
             ).set_position("center").set_duration(duration)
 
             # Add fade in/out
@@ -114,6 +462,23 @@ class VideoEditor:
         Returns:
             Outro video clip
         """
+        return await asyncio.to_thread(self._render_outro, duration)
+
+    def _render_outro(self, duration: float) -> VideoClip:
+        """Build the outro clip, loading it from the clip cache when possible.
+
+        Args:
+            duration: Outro duration in seconds
+
+        Returns:
+            Outro video clip
+        """
+        cache_path = self._clip_cache_path("outro", OUTRO_TEXT, duration)
+        cached = self._load_cached_clip(cache_path)
+        if cached is not None:
+            logger.info(f"Using cached outro clip: {duration}s")
+            return cached
+
         # Create background
         background = ColorClip(
             size=(self.width, self.height),
@@ -123,8 +488,8 @@ class VideoEditor:
 
         try:
             # Subscribe message
-            subscribe_text = TextClip(
-                "チャンネル登録をお願いします！",
+            subscribe_text = _text_clip(
+                OUTRO_TEXT,
                 fontsize=60,
                 color="white",
                 font="Arial-Bold",
@@ -135,7 +500,7 @@ class VideoEditor:
             outro = CompositeVideoClip([background, subscribe_text])
 
             logger.info(f"Created outro clip: {duration}s")
-            return outro
+            return self._cache_clip(outro, cache_path)
 
         except Exception as e:
             logger.error(f"Error creating outro: {e}")
@@ -149,6 +514,9 @@ class VideoEditor:
     ) -> VideoClip:
         """Create video scene from image.
 
+        Image decoding and text rendering run in a worker thread, so several
+        scenes can be built concurrently.
+
         Args:
             image_path: Path to image file
             duration: Scene duration in seconds
@@ -157,33 +525,38 @@ class VideoEditor:
         Returns:
             Video clip
         """
-        try:
-            # Load and resize image
-            img_clip = ImageClip(str(image_path)).set_duration(duration)
+        return await asyncio.to_thread(
+            self._render_scene, image_path, duration, text_overlay
+        )
 
-            # Resize to fit while maintaining aspect ratio
-            img_clip = img_clip.resize(height=self.height)
+    def _render_scene(
+        self,
+        image_path: Path,
+        duration: float,
+        text_overlay: Optional[str],
+    ) -> VideoClip:
+        """Build a video scene from an image.
 
-            # Center crop if wider than target
-            if img_clip.w > self.width:
-                img_clip = img_clip.crop(
-                    x_center=img_clip.w / 2,
-                    width=self.width,
-                )
+        Args:
+            image_path: Path to image file
+            duration: Scene duration in seconds
+            text_overlay: Optional text to overlay
+
+        Returns:
+            Video clip
+        """
+        try:
+            # The scene is a still picture, so composite it into a single
+            # frame once; ImageClip then returns that same array for every
+            # frame instead of allocating and blending a new one
+            frame = self._load_scene_frame(image_path)
 
             # Add text overlay if provided
             if text_overlay:
-                text_clip = TextClip(
-                    text_overlay,
-                    fontsize=40,
-                    color="white",
-                    bg_color="rgba(0,0,0,0.5)",
-                    font="Arial-Bold",
-                    size=(self.width - 100, None),
-                    method="caption",
-                ).set_position(("center", "bottom")).set_duration(duration)
-
-                img_clip = CompositeVideoClip([img_clip, text_clip])
+                text_rgb, text_alpha = _render_caption(text_overlay, self.width - 100, 40)
+                self._overlay_bottom_center(frame, text_rgb, text_alpha)
+
+            img_clip = ImageClip(frame).set_duration(duration)
 
             # Add fade in/out transitions
             img_clip = fadein(img_clip, 0.5)
@@ -200,6 +573,65 @@ class VideoEditor:
                 duration=duration,
             )
 
+    def _load_scene_frame(self, image_path: Path) -> np.ndarray:
+        """Load an image as a full-size frame.
+
+        The image is scaled to the frame height, center-cropped if wider than
+        the frame and centered on black if narrower.
+
+        Args:
+            image_path: Path to image file
+
+        Returns:
+            RGB frame of shape (height, width, 3)
+        """
+        with Image.open(image_path) as img:
+            # The size is known from the header; downloaded images are often
+            # already at the frame height, so skip the resample for those
+            width = max(1, round(img.width * self.height / img.height))
+            img = img.convert("RGB")
+            if img.height != self.height:
+                img = img.resize((width, self.height), Image.Resampling.LANCZOS)
+            pixels = np.asarray(img)
+
+        if width >= self.width:
+            x0 = (width - self.width) // 2
+            return pixels[:, x0:x0 + self.width].copy()
+
+        frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+        x0 = (self.width - width) // 2
+        frame[:, x0:x0 + width] = pixels
+        return frame
+
+    def _overlay_bottom_center(
+        self,
+        frame: np.ndarray,
+        overlay: np.ndarray,
+        alpha: Optional[np.ndarray] = None,
+    ) -> None:
+        """Blend an overlay onto the bottom center of a frame in place.
+
+        Args:
+            frame: RGB frame to draw on
+            overlay: RGB overlay pixels
+            alpha: Optional overlay opacity in [0, 1], opaque if omitted
+        """
+        h = min(overlay.shape[0], frame.shape[0])
+        w = min(overlay.shape[1], frame.shape[1])
+        oy = overlay.shape[0] - h
+        ox = (overlay.shape[1] - w) // 2
+        y0 = frame.shape[0] - h
+        x0 = (frame.shape[1] - w) // 2
+
+        src = overlay[oy:oy + h, ox:ox + w, :3]
+        region = frame[y0:y0 + h, x0:x0 + w]
+        if alpha is None:
+            region[:] = src
+            return
+
+        a = alpha[oy:oy + h, ox:ox + w, None]
+        region[:] = np.rint(region + (src - region.astype(np.float32)) * a).astype(np.uint8)
+
     async def create_video(
         self,
         scenes: List[VideoScene],
@@ -227,29 +659,31 @@ class VideoEditor:
         logger.info(f"Creating video with {len(scenes)} scenes")
 
         try:
-            clips = []
-
-            # Add intro
+            # Build intro, scenes and outro concurrently; gather keeps order
+            builders = []
             if add_intro:
-                intro = await self.create_intro(title, duration=3.0)
-                clips.append(intro)
-
-            # Add main content scenes
-            for scene in scenes:
-                scene_clip = await self.create_scene_from_image(
+                builders.append(self.create_intro(title, duration=3.0))
+            builders.extend(
+                self.create_scene_from_image(
                     scene.image_path,
                     scene.duration,
                     scene.text_overlay,
                 )
-                clips.append(scene_clip)
-
-            # Add outro
+                for scene in scenes
+            )
             if add_outro:
-                outro = await self.create_outro(duration=5.0)
-                clips.append(outro)
+                builders.append(self.create_outro(duration=5.0))
+
+            clips = list(await asyncio.gather(*builders))
 
-            # Concatenate all clips
-            final_video = concatenate_videoclips(clips, method="compose")
+            # Concatenate all clips; chaining passes frames through untouched,
+            # compositing is only needed to center clips of another size
+            # (e.g. images narrower than the frame)
+            if all(tuple(clip.size) == (self.width, self.height) for clip in clips):
+                method = "chain"
+            else:
+                method = "compose"
+            final_video = concatenate_videoclips(clips, method=method)
 
             # Add audio narration
             if audio_path and audio_path.exists():
@@ -280,16 +714,22 @@ class VideoEditor:
 
             # Write video file
             logger.info(f"Writing video to {output_path}")
-            final_video.write_videofile(
-                str(output_path),
-                fps=self.fps,
-                codec="libx264",
-                audio_codec="aac",
-                audio_bitrate=settings.audio_bitrate,
-                bitrate=settings.video_bitrate,
-                preset="medium",
-                threads=4,
-            )
+            try:
+                self._write_video(final_video, output_path, self.codec)
+            except Exception as e:
+                if self.codec == SOFTWARE_ENCODER:
+                    raise
+
+                # A hardware encoder that passed the probe can still fail on a
+                # real encode (session limits, driver issues); finish this
+                # render in software and probe again for the next one
+                logger.warning(
+                    f"Encoding with {self.codec} failed, retrying with "
+                    f"{SOFTWARE_ENCODER}: {e}"
+                )
+                self._write_video(final_video, output_path, SOFTWARE_ENCODER)
+                _encoder_works.cache_clear()
+                self.codec = select_video_codec()
 
             # Clean up
             final_video.close()
@@ -303,6 +743,32 @@ class VideoEditor:
             logger.error(f"Error creating video: {e}")
             raise
 
+    def _write_video(self, clip: VideoClip, output_path: Path, codec: str) -> None:
+        """Encode a clip to a video file.
+
+        Args:
+            clip: Final video clip
+            output_path: Output video path
+            codec: FFmpeg video encoder
+        """
+        clip.write_videofile(
+            str(output_path),
+            fps=self.fps,
+            codec=codec,
+            audio_codec="aac",
+            audio_bitrate=settings.audio_bitrate,
+            bitrate=settings.video_bitrate,
+            preset=ENCODER_PRESETS.get(codec, "medium"),
+            threads=4,
+            ffmpeg_params=[
+                *ENCODER_PARAMS.get(codec, []),
+                # Keyframe every GOP_SECONDS, and move the index to the
+                # front so playback and upload processing can start early
+                "-g", str(self.fps * GOP_SECONDS),
+                "-movflags", "+faststart",
+            ],
+        )
+
     async def create_simple_video(
         self,
         images: List[Path],
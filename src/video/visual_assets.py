@@ -1,12 +1,17 @@
 """Visual assets collection and generation module."""
 
+import asyncio
 import random
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import BinaryIO, List, Optional, Tuple
 from io import BytesIO
 
-import requests
-from PIL import Image
+import cv2
+import httpx
+import numpy as np
+import PIL
+from PIL import Image, ImageFont, features
 
 from src.core.config import get_settings
 from src.core.logging import get_logger
@@ -15,6 +20,70 @@ from src.utils.helpers import sanitize_filename, ensure_directory
 logger = get_logger(__name__)
 settings = get_settings()
 
+# Pillow-SIMD is a drop-in Pillow build (versions like "9.5.0.post1") with
+# SIMD resize and JPEG kernels; nothing here depends on it, but report it so
+# slow image processing can be traced to a stock build
+PILLOW_SIMD = ".post" in PIL.__version__
+logger.debug(
+    f"Pillow {PIL.__version__} (SIMD: {PILLOW_SIMD}, "
+    f"libjpeg-turbo: {features.check_feature('libjpeg_turbo')})"
+)
+
+# Downloaded images are scaled down to fit within this size
+MAX_IMAGE_SIZE = (1920, 1080)
+
+TITLE_FONT_PATH = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+
+# Width of the dark outline around title card text, in pixels
+TITLE_STROKE_WIDTH = 3
+
+# Connection pool shared by API searches and image downloads
+HTTP_TIMEOUT = 30
+HTTP_MAX_CONNECTIONS = 16
+
+# Idle connections are kept open this long (seconds) so the search call and
+# the downloads that follow it reuse the same TLS sessions
+HTTP_KEEPALIVE_EXPIRY = 60
+
+HTTP_USER_AGENT = "auto-tube/0.1.0"
+
+
+@lru_cache(maxsize=32)
+def _load_font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    """Load a TrueType font, cached per path and size.
+
+    Args:
+        path: Font file path
+        size: Font size
+
+    Returns:
+        Font object, or the default font if the file cannot be loaded
+    """
+    try:
+        return ImageFont.truetype(path, size)
+    except Exception:
+        logger.warning(f"Font {path} not available, using default font")
+        return ImageFont.load_default()
+
+
+@lru_cache(maxsize=1024)
+def _measure_text(
+    font: ImageFont.FreeTypeFont,
+    text: str,
+    stroke_width: int = 0,
+) -> Tuple[int, int, int, int]:
+    """Get the bounding box of text, cached per font, text and stroke.
+
+    Args:
+        font: Font to use
+        text: Text to measure
+        stroke_width: Outline width included in the box
+
+    Returns:
+        Bounding box as (left, top, right, bottom)
+    """
+    return font.getbbox(text, stroke_width=stroke_width)
+
 
 class VisualAssetsCollector:
     """Collect and generate visual assets for videos."""
@@ -23,6 +92,40 @@ class VisualAssetsCollector:
         """Initialize visual assets collector."""
         self.unsplash_api_key = None  # Optional
         self.pexels_api_key = None  # Optional
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def _http(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client, creating it on first use after close()."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=HTTP_TIMEOUT,
+                follow_redirects=True,
+                headers={"User-Agent": HTTP_USER_AGENT},
+                limits=httpx.Limits(
+                    max_connections=HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=HTTP_MAX_CONNECTIONS,
+                    keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+                ),
+            )
+        return self._client
+
+    async def __aenter__(self) -> "VisualAssetsCollector":
+        """Enter the collector's async context."""
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close the HTTP client when leaving the context."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the pooled HTTP connections.
+
+        The collector stays usable; a later request opens a new client.
+        """
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.aclose()
 
     async def search_unsplash(
         self,
@@ -51,19 +154,14 @@ class VisualAssetsCollector:
                 "orientation": "landscape",
             }
 
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response = await self._http.get(url, headers=headers, params=params)
             response.raise_for_status()
             data = response.json()
 
-            images = []
-            for idx, result in enumerate(data.get("results", [])[:count]):
-                image_url = result["urls"]["regular"]
-                image_path = await self._download_image(
-                    image_url,
-                    f"{sanitize_filename(query)}_{idx}.jpg",
-                )
-                if image_path:
-                    images.append(image_path)
+            images = await self._download_images(
+                [result["urls"]["regular"] for result in data.get("results", [])[:count]],
+                query,
+            )
 
             logger.info(f"Downloaded {len(images)} images from Unsplash")
             return images
@@ -99,19 +197,14 @@ class VisualAssetsCollector:
                 "orientation": "landscape",
             }
 
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response = await self._http.get(url, headers=headers, params=params)
             response.raise_for_status()
             data = response.json()
 
-            images = []
-            for idx, photo in enumerate(data.get("photos", [])[:count]):
-                image_url = photo["src"]["large"]
-                image_path = await self._download_image(
-                    image_url,
-                    f"{sanitize_filename(query)}_{idx}.jpg",
-                )
-                if image_path:
-                    images.append(image_path)
+            images = await self._download_images(
+                [photo["src"]["large"] for photo in data.get("photos", [])[:count]],
+                query,
+            )
 
             logger.info(f"Downloaded {len(images)} images from Pexels")
             return images
@@ -120,6 +213,23 @@ class VisualAssetsCollector:
             logger.error(f"Error searching Pexels: {e}")
             return await self._get_fallback_images(count)
 
+    async def _download_images(self, urls: List[str], query: str) -> List[Path]:
+        """Download several images concurrently.
+
+        Args:
+            urls: Image URLs
+            query: Search query used to name the files
+
+        Returns:
+            Paths of the images that downloaded successfully, in URL order
+        """
+        prefix = sanitize_filename(query)
+        ensure_directory(settings.image_output_path)
+        paths = await asyncio.gather(
+            *[self._download_image(url, f"{prefix}_{idx}.jpg") for idx, url in enumerate(urls)]
+        )
+        return [path for path in paths if path]
+
     async def _download_image(
         self,
         url: str,
@@ -135,24 +245,17 @@ class VisualAssetsCollector:
             Path to downloaded image or None
         """
         try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-
-            # Load and process image
-            img = Image.open(BytesIO(response.content))
-
-            # Convert to RGB if necessary
-            if img.mode != "RGB":
-                img = img.convert("RGB")
-
-            # Resize if too large
-            max_size = (1920, 1080)
-            img.thumbnail(max_size, Image.Resampling.LANCZOS)
-
-            # Save image
-            output_path = settings.image_output_path / filename
-            ensure_directory(output_path.parent)
-            img.save(output_path, "JPEG", quality=90)
+            # Write the body into one buffer as it arrives; response.content
+            # would hold every chunk and then a joined copy of them
+            stream = BytesIO()
+            async with self._http.stream("GET", url) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes():
+                    stream.write(chunk)
+            stream.seek(0)
+
+            # Decoding and resizing are CPU-bound, keep them off the event loop
+            output_path = await asyncio.to_thread(self._save_image, stream, filename)
 
             logger.info(f"Downloaded image: {output_path}")
             return output_path
@@ -161,6 +264,43 @@ class VisualAssetsCollector:
             logger.error(f"Error downloading image from {url}: {e}")
             return None
 
+    def _save_image(self, stream: BinaryIO, filename: str) -> Path:
+        """Decode, resize and save a downloaded image.
+
+        Args:
+            stream: Encoded image data
+            filename: Output filename
+
+        Returns:
+            Path to saved image
+        """
+        # Load and process image; only the header is read at this point
+        img = Image.open(stream)
+
+        # Fit within the maximum size, keeping the aspect ratio
+        scale = min(MAX_IMAGE_SIZE[0] / img.width, MAX_IMAGE_SIZE[1] / img.height)
+        size = None
+        if scale < 1:
+            size = (max(1, round(img.width * scale)), max(1, round(img.height * scale)))
+            # Let the JPEG decoder scale by 1/2, 1/4 or 1/8 during the IDCT,
+            # never going below the target size; other formats ignore this
+            img.draft("RGB", size)
+
+        # Convert to RGB if necessary
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+
+        # Resize the rest of the way; OpenCV's area interpolation is a fast,
+        # alias-free filter for downscaling
+        if size is not None and img.size != size:
+            pixels = cv2.resize(np.asarray(img), size, interpolation=cv2.INTER_AREA)
+            img = Image.fromarray(pixels)
+
+        # Save image (the directory is created by _download_images)
+        output_path = settings.image_output_path / filename
+        img.save(output_path, "JPEG", quality=90)
+        return output_path
+
     async def _get_fallback_images(self, count: int = 5) -> List[Path]:
         """Generate fallback placeholder images.
 
@@ -170,34 +310,52 @@ class VisualAssetsCollector:
         Returns:
             List of generated image paths
         """
-        images = []
-
-        for i in range(count):
-            # Generate gradient placeholder
-            img = Image.new("RGB", (1920, 1080))
-            pixels = img.load()
-
-            # Create gradient
-            color_start = random.randint(50, 150)
-            color_end = random.randint(100, 200)
-
-            for y in range(1080):
-                r = int(color_start + (color_end - color_start) * y / 1080)
-                g = int(color_start + (color_end - color_start) * y / 1080)
-                b = int(color_start + (color_end - color_start) * y / 1080)
-                for x in range(1920):
-                    pixels[x, y] = (r, g, b)
-
-            # Save placeholder
-            filename = f"placeholder_{i}.jpg"
-            output_path = settings.image_output_path / filename
-            ensure_directory(output_path.parent)
-            img.save(output_path, "JPEG")
-            images.append(output_path)
+        ensure_directory(settings.image_output_path)
+
+        # Pick the colors up front so they follow the random sequence in
+        # order, then render in worker threads; Pillow releases the GIL while
+        # resizing and encoding, so placeholders are produced in parallel
+        colors = [(random.randint(50, 150), random.randint(100, 200)) for _ in range(count)]
+        images = list(
+            await asyncio.gather(
+                *[
+                    asyncio.to_thread(self._render_placeholder, i, color_start, color_end)
+                    for i, (color_start, color_end) in enumerate(colors)
+                ]
+            )
+        )
 
         logger.info(f"Generated {len(images)} fallback images")
         return images
 
+    def _render_placeholder(
+        self,
+        index: int,
+        color_start: int,
+        color_end: int,
+    ) -> Path:
+        """Render and save one gradient placeholder image.
+
+        Args:
+            index: Placeholder number, used in the filename
+            color_start: Grey level at the top
+            color_end: Grey level at the bottom
+
+        Returns:
+            Path to the saved placeholder
+        """
+        # Generate gradient placeholder: the ramp is grey, so compute one
+        # value per row and stretch the 1px column to full width
+        rows = np.arange(1080, dtype=np.float64)
+        column = (color_start + (color_end - color_start) * rows / 1080).astype(np.uint8)
+        img = Image.fromarray(column[:, None], "L")
+        img = img.resize((1920, 1080), Image.Resampling.NEAREST).convert("RGB")
+
+        # Save placeholder
+        output_path = settings.image_output_path / f"placeholder_{index}.jpg"
+        img.save(output_path, "JPEG")
+        return output_path
+
     async def collect_images_for_topic(
         self,
         topic: str,
@@ -248,31 +406,31 @@ class VisualAssetsCollector:
         Returns:
             Path to created image
         """
-        from PIL import ImageDraw, ImageFont
+        from PIL import ImageDraw
 
         # Create image
         img = Image.new("RGB", (1920, 1080), background_color)
         draw = ImageDraw.Draw(img)
 
-        # Try to load font, fallback to default if not available
-        try:
-            font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 80)
-        except Exception:
-            font = ImageFont.load_default()
-            logger.warning("Using default font for title card")
+        font = _load_font(TITLE_FONT_PATH, 80)
 
-        # Calculate text size and position
-        bbox = draw.textbbox((0, 0), title, font=font)
+        # Calculate text size and position, including the outline
+        bbox = _measure_text(font, title, TITLE_STROKE_WIDTH)
         text_width = bbox[2] - bbox[0]
         text_height = bbox[3] - bbox[1]
 
         x = (1920 - text_width) // 2
         y = (1080 - text_height) // 2
 
-        # Draw text with shadow
-        shadow_offset = 3
-        draw.text((x + shadow_offset, y + shadow_offset), title, font=font, fill=(0, 0, 0))
-        draw.text((x, y), title, font=font, fill=(255, 255, 255))
+        # Draw text with a dark outline in a single pass
+        draw.text(
+            (x, y),
+            title,
+            font=font,
+            fill=(255, 255, 255),
+            stroke_width=TITLE_STROKE_WIDTH,
+            stroke_fill=(0, 0, 0),
+        )
 
         # Save image
         ensure_directory(output_path.parent)
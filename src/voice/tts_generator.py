@@ -1,18 +1,47 @@
 """Text-to-Speech generation module."""
 
+import asyncio
+import math
+import os
+import re
+import shutil
+import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
-from elevenlabs import generate, save
+from elevenlabs import generate
 from elevenlabs.client import ElevenLabs
+from moviepy.config import get_setting
 
 from src.core.config import get_settings
 from src.core.logging import get_logger
-from src.utils.helpers import sanitize_filename
+from src.utils.helpers import ensure_directory, generate_hash, sanitize_filename
 
 logger = get_logger(__name__)
 settings = get_settings()
 
+TTS_MODEL = "eleven_multilingual_v2"
+
+# Synthesized speech keyed by voice, model and text; a cache hit refreshes the
+# file's mtime so cleanup_old_files only drops entries that stop being used
+TTS_CACHE_PATH = settings.cache_path / "tts"
+
+# Scripts longer than this many characters are synthesized in sentence-aligned
+# chunks, at most TTS_MAX_CONCURRENCY requests at a time
+TTS_CHUNK_CHARS = 500
+TTS_MAX_CONCURRENCY = 4
+
+# Split points after sentence-ending punctuation
+_SENTENCE_END_RE = re.compile(r"(?<=[。！？!?])")
+
+# Speaking rates used by estimate_speech_duration
+CJK_CHARS_PER_SECOND = 5.5
+LATIN_WORDS_PER_SECOND = 2.5
+
+# Kana, kanji and half-width katakana; and runs of Latin letters or digits
+_CJK_CHAR_RE = re.compile(r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uff66-\uff9f]")
+_LATIN_WORD_RE = re.compile(r"[A-Za-z0-9]+")
+
 
 class TTSGenerator:
     """Generate speech from text using ElevenLabs or Google TTS."""
@@ -56,18 +85,20 @@ class TTSGenerator:
             # Use provided voice_id or default
             voice = voice_id or self.voice_id
 
+            # Reuse earlier audio for the same voice, model and text
+            cache_key = generate_hash(f"{voice}|{TTS_MODEL}|{text}")
+            cache_path = TTS_CACHE_PATH / f"{cache_key}.mp3"
+            if cache_path.exists():
+                cache_path.touch()
+                shutil.copyfile(cache_path, output_path)
+                logger.info(f"Speech loaded from cache: {output_path}")
+                return output_path
+
             logger.info(f"Generating speech for {len(text)} characters")
 
-            # Generate audio using ElevenLabs
-            audio = generate(
-                text=text,
-                voice=voice,
-                model="eleven_multilingual_v2",
-                api_key=settings.elevenlabs_api_key,
-            )
+            await asyncio.to_thread(self._synthesize, text, voice, output_path)
 
-            # Save audio to file
-            save(audio, str(output_path))
+            self._store_in_cache(output_path, cache_path)
 
             logger.info(f"Speech generated successfully: {output_path}")
             return output_path
@@ -76,6 +107,50 @@ class TTSGenerator:
             logger.error(f"Error generating speech: {e}")
             raise
 
+    def _synthesize(self, text: str, voice: str, output_path: Path) -> None:
+        """Synthesize speech with ElevenLabs into a file.
+
+        Args:
+            text: Text to convert to speech
+            voice: Voice ID to use
+            output_path: Output file path
+        """
+        # Write chunks to the file as they arrive instead of holding the whole
+        # MP3 in memory
+        audio_stream = generate(
+            text=text,
+            voice=voice,
+            model=TTS_MODEL,
+            api_key=settings.elevenlabs_api_key,
+            stream=True,
+        )
+
+        try:
+            with open(output_path, "wb") as f:
+                for chunk in audio_stream:
+                    if chunk:
+                        f.write(chunk)
+        except Exception:
+            # Don't leave a truncated file behind
+            output_path.unlink(missing_ok=True)
+            raise
+
+    def _store_in_cache(self, audio_path: Path, cache_path: Path) -> None:
+        """Copy generated audio into the TTS cache.
+
+        Args:
+            audio_path: Generated audio file
+            cache_path: Cache entry to create
+        """
+        try:
+            ensure_directory(cache_path.parent)
+            # Copy under a temporary name so readers never see a partial file
+            tmp_path = cache_path.with_name(f"{cache_path.stem}.{os.getpid()}.tmp")
+            shutil.copyfile(audio_path, tmp_path)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Failed to cache speech {cache_path}: {e}")
+
     async def generate_speech_for_script(
         self,
         script: str,
@@ -83,6 +158,9 @@ class TTSGenerator:
     ) -> Path:
         """Generate speech for entire video script.
 
+        Long scripts are split at sentence boundaries and the parts are
+        synthesized concurrently, then joined without re-encoding.
+
         Args:
             script: Complete video script
             video_id: Video identifier
@@ -91,7 +169,88 @@ class TTSGenerator:
             Path to generated audio file
         """
         output_path = settings.audio_output_path / f"{video_id}_narration.mp3"
-        return await self.generate_speech(script, output_path)
+
+        parts = self._split_script(script)
+        if len(parts) <= 1:
+            return await self.generate_speech(script, output_path)
+
+        logger.info(f"Generating speech for script in {len(parts)} parts")
+        semaphore = asyncio.Semaphore(TTS_MAX_CONCURRENCY)
+
+        async def synthesize_part(text: str, path: Path) -> Path:
+            async with semaphore:
+                return await self.generate_speech(text, path)
+
+        with tempfile.TemporaryDirectory(dir=settings.audio_output_path) as tmp_dir:
+            part_paths = await asyncio.gather(
+                *[
+                    synthesize_part(text, Path(tmp_dir) / f"{idx:04d}.mp3")
+                    for idx, text in enumerate(parts)
+                ]
+            )
+            await self._concatenate_audio(part_paths, output_path)
+
+        logger.info(f"Speech generated successfully: {output_path}")
+        return output_path
+
+    def _split_script(self, script: str) -> List[str]:
+        """Split a script into sentence-aligned parts of bounded length.
+
+        Args:
+            script: Complete video script
+
+        Returns:
+            Script parts; a single sentence longer than the limit is kept whole
+        """
+        parts: List[str] = []
+        current = ""
+        for sentence in _SENTENCE_END_RE.split(script):
+            if current and len(current) + len(sentence) > TTS_CHUNK_CHARS:
+                parts.append(current)
+                current = ""
+            current += sentence
+
+        if current.strip():
+            parts.append(current)
+        return parts
+
+    async def _concatenate_audio(self, part_paths: List[Path], output_path: Path) -> None:
+        """Join MP3 files with FFmpeg's concat demuxer, without re-encoding.
+
+        Args:
+            part_paths: Audio files in playback order
+            output_path: Output file path
+        """
+        list_path = output_path.with_name(f"{output_path.stem}.concat.txt")
+        list_path.write_text(
+            "".join(f"file '{path.resolve()}'\n" for path in part_paths),
+            encoding="utf-8",
+        )
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                get_setting("FFMPEG_BINARY"),
+                "-y",
+                "-hide_banner",
+                "-loglevel",
+                "error",
+                "-f",
+                "concat",
+                "-safe",
+                "0",
+                "-i",
+                str(list_path),
+                "-c",
+                "copy",
+                str(output_path),
+                stderr=asyncio.subprocess.PIPE,
+            )
+            _, stderr = await process.communicate()
+        finally:
+            list_path.unlink(missing_ok=True)
+
+        if process.returncode != 0:
+            raise RuntimeError(f"Failed to concatenate audio: {stderr.decode(errors='replace')}")
 
     def estimate_speech_duration(self, text: str) -> int:
         """Estimate speech duration in seconds.
@@ -102,8 +261,10 @@ class TTSGenerator:
         Returns:
             Estimated duration in seconds
         """
-        # Japanese speech: approximately 5-6 characters per second
-        # This is a rough estimate
-        chars_per_second = 5
-        duration = len(text) // chars_per_second
-        return duration
+        # Kana and kanji are spoken at roughly 5.5 characters per second and
+        # embedded English words or numbers at roughly 2.5 words per second;
+        # punctuation and whitespace take no time
+        cjk_chars = len(_CJK_CHAR_RE.findall(text))
+        latin_words = len(_LATIN_WORD_RE.findall(text))
+        seconds = cjk_chars / CJK_CHARS_PER_SECOND + latin_words / LATIN_WORDS_PER_SECOND
+        return math.ceil(seconds)
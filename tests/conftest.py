@@ -0,0 +1,13 @@
+"""Shared pytest configuration."""
+
+import sys
+from types import ModuleType
+
+try:
+    import elevenlabs.client  # noqa: F401
+except ImportError:
+    # The pinned elevenlabs release has no elevenlabs.client, which
+    # src.voice.tts_generator imports; no test calls the ElevenLabs API
+    _client = ModuleType("elevenlabs.client")
+    _client.ElevenLabs = object
+    sys.modules["elevenlabs.client"] = _client
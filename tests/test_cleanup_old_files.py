@@ -0,0 +1,147 @@
+"""Tests for the directory scan cache of cleanup_old_files."""
+
+import os
+import time
+from types import SimpleNamespace
+
+import pytest
+
+tasks = pytest.importorskip("src.scheduler.tasks")
+
+DAY = 86400
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    """Point cleanup_old_files at temporary directories.
+
+    Returns:
+        The video output directory, the only directory that exists
+    """
+    video_dir = tmp_path / "videos"
+    video_dir.mkdir()
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+
+    monkeypatch.setattr(
+        tasks,
+        "settings",
+        SimpleNamespace(
+            video_output_path=video_dir,
+            audio_output_path=tmp_path / "audio",
+            image_output_path=tmp_path / "images",
+            cache_path=cache_dir,
+        ),
+    )
+    monkeypatch.setattr(tasks, "CLIP_CACHE_PATH", tmp_path / "clips")
+    monkeypatch.setattr(tasks, "TTS_CACHE_PATH", tmp_path / "tts")
+    return video_dir
+
+
+@pytest.fixture
+def scanned(monkeypatch):
+    """Record the directories cleanup_old_files scans.
+
+    Returns:
+        List of scanned directory paths, in call order
+    """
+    calls = []
+    real_scandir = os.scandir
+
+    def scandir(path):
+        calls.append(str(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(tasks.os, "scandir", scandir)
+    return calls
+
+
+def make_file(directory, name, age_days):
+    """Create a file whose mtime is age_days in the past."""
+    path = directory / name
+    path.write_bytes(b"x" * 10)
+    mtime = time.time() - age_days * DAY
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_unchanged_directory_is_skipped(storage, scanned):
+    make_file(storage, "recent.mp4", age_days=1)
+
+    first = tasks.cleanup_old_files(days_old=30)
+    second = tasks.cleanup_old_files(days_old=30)
+
+    assert first["status"] == second["status"] == "success"
+    assert scanned == [str(storage)]
+
+
+def test_changed_directory_is_rescanned(storage, scanned):
+    make_file(storage, "recent.mp4", age_days=1)
+    tasks.cleanup_old_files(days_old=30)
+
+    make_file(storage, "new.mp4", age_days=0)
+    # Make sure the directory mtime moves even on coarse-grained filesystems
+    dir_mtime = os.stat(storage).st_mtime + 1
+    os.utime(storage, (dir_mtime, dir_mtime))
+    tasks.cleanup_old_files(days_old=30)
+
+    assert scanned == [str(storage), str(storage)]
+
+
+def test_directory_is_rescanned_when_oldest_file_passes_cutoff(storage, scanned):
+    old_file = make_file(storage, "aging.mp4", age_days=10)
+
+    first = tasks.cleanup_old_files(days_old=30)
+    assert first["deleted_count"] == 0
+
+    # The directory is unchanged, but its oldest file is now past the cutoff
+    second = tasks.cleanup_old_files(days_old=5)
+
+    assert second["deleted_count"] == 1
+    assert not old_file.exists()
+    assert scanned == [str(storage), str(storage)]
+
+
+def test_failed_unlink_forces_rescan(storage, scanned, monkeypatch):
+    old_file = make_file(storage, "stale.mp4", age_days=40)
+
+    def failing_unlink(path):
+        raise PermissionError(path)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(tasks.os, "unlink", failing_unlink)
+        first = tasks.cleanup_old_files(days_old=30)
+
+    assert first["deleted_count"] == 0
+    assert old_file.exists()
+
+    # Nothing in the directory changed, but the file is still due for deletion
+    second = tasks.cleanup_old_files(days_old=30)
+
+    assert second["deleted_count"] == 1
+    assert not old_file.exists()
+    assert scanned == [str(storage), str(storage)]
+
+
+def test_file_created_during_scan_forces_rescan(storage, scanned, monkeypatch):
+    make_file(storage, "stale.mp4", age_days=40)
+    real_scandir = tasks.os.scandir
+
+    def scandir_then_write(path):
+        entries = real_scandir(path)
+        make_file(storage, "late.mp4", age_days=0)
+        # Make sure the directory mtime moves even on coarse-grained filesystems
+        dir_mtime = os.stat(storage).st_mtime + 1
+        os.utime(storage, (dir_mtime, dir_mtime))
+        return entries
+
+    with monkeypatch.context() as patch:
+        patch.setattr(tasks.os, "scandir", scandir_then_write)
+        first = tasks.cleanup_old_files(days_old=30)
+
+    assert first["deleted_count"] == 1
+
+    # The deletion must not hide the file created while the scan was running
+    tasks.cleanup_old_files(days_old=30)
+
+    assert scanned == [str(storage), str(storage)]
@@ -0,0 +1,40 @@
+"""Tests for URL validation in src.utils.helpers."""
+
+from urllib.parse import urlparse
+
+import pytest
+
+from src.utils.helpers import is_valid_url
+
+
+def reference_is_valid_url(url):
+    """Validate url with urlparse, as is_valid_url originally did."""
+    try:
+        result = urlparse(url)
+        return all([result.scheme, result.netloc])
+    except Exception:
+        return False
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("https://example.com/watch?v=1", True),
+        ("  https://example.com", True),
+        ("ht\ttp://example.com", True),
+        ("http://\nexample.com", True),
+        ("http://[::1]:8080/", True),
+        ("http://[bad", False),
+        ("http://bad]", False),
+        ("http://[not-an-ip]/", False),
+        ("http://\t", False),
+        ("http:///path", False),
+        ("example.com", False),
+        ("1http://example.com", False),
+        ("", False),
+        (None, False),
+    ],
+)
+def test_is_valid_url_matches_urlparse(url, expected):
+    assert is_valid_url(url) is expected
+    assert reference_is_valid_url(url) is expected